@@ -11,14 +11,17 @@ Usage:
 """
 
 import argparse
+import importlib
+import importlib.util
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from dotenv import load_dotenv
-load_dotenv()
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, distribution
 
-import yaml
+from storage.yaml_cache import load_yaml
 
 # ── Colour helpers (work on Windows 10+ terminals) ───────────────
 RESET  = "\033[0m"
@@ -29,47 +32,68 @@ CYAN   = "\033[96m"
 BOLD   = "\033[1m"
 DIM    = "\033[2m"
 
+# Inputs are a small, repetitive set of labels, so memoise the wrapping
+@lru_cache(maxsize=512)
 def green(s):  return f"{GREEN}{s}{RESET}"
+@lru_cache(maxsize=512)
 def red(s):    return f"{RED}{s}{RESET}"
+@lru_cache(maxsize=512)
 def yellow(s): return f"{YELLOW}{s}{RESET}"
+@lru_cache(maxsize=512)
 def cyan(s):   return f"{CYAN}{s}{RESET}"
+@lru_cache(maxsize=512)
 def bold(s):   return f"{BOLD}{s}{RESET}"
+@lru_cache(maxsize=512)
 def dim(s):    return f"{DIM}{s}{RESET}"
 
-# Enable ANSI on Windows
+_OK   = green("✓")
+_FAIL = red("✗")
+_SKIP = yellow("○")
+_MISS = red("✗ MISSING")
+
+# Enable ANSI on Windows 10+ (VT processing); other platforms need nothing
 import os
-os.system("")
+if sys.platform == "win32":
+    try:
+        import ctypes
+        _k32 = ctypes.windll.kernel32
+        _k32.SetConsoleMode(_k32.GetStdHandle(-11), 7)  # STD_OUTPUT_HANDLE, +VT processing
+    except Exception:
+        os.system("")
 
 
 def load_config(path="config.yaml"):
-    with open(path) as f:
-        return yaml.safe_load(f)
+    return load_yaml(path)
+
+
+_ENV_VARS = (
+    ("EMAIL_USER",      "required",  "SMTP sender address"),
+    ("EMAIL_PASS",      "required",  "Gmail App Password"),
+    ("LINKEDIN_EMAIL",  "optional",  "LinkedIn login (more results)"),
+    ("LINKEDIN_PASS",   "optional",  "LinkedIn password"),
+    ("SERPAPI_KEY",     "optional",  "Google Jobs via SerpAPI"),
+    ("TELEGRAM_TOKEN",  "optional",  "Telegram bot token"),
+    ("TELEGRAM_CHAT_ID","optional",  "Telegram chat ID"),
+)
 
 
 def check_env_vars():
     """Check all environment variables and report status."""
     print(f"\n{bold('━━━ Environment Variables ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━')}")
 
-    vars_to_check = [
-        ("EMAIL_USER",      "required",  "SMTP sender address"),
-        ("EMAIL_PASS",      "required",  "Gmail App Password"),
-        ("LINKEDIN_EMAIL",  "optional",  "LinkedIn login (more results)"),
-        ("LINKEDIN_PASS",   "optional",  "LinkedIn password"),
-        ("SERPAPI_KEY",     "optional",  "Google Jobs via SerpAPI"),
-        ("TELEGRAM_TOKEN",  "optional",  "Telegram bot token"),
-        ("TELEGRAM_CHAT_ID","optional",  "Telegram chat ID"),
-    ]
+    # One pass over os.environ instead of a lookup per variable
+    env = {var: os.environ.get(var, "") for var, _, _ in _ENV_VARS}
 
     all_required_ok = True
-    for var, level, desc in vars_to_check:
-        val = os.environ.get(var, "")
+    for var, level, desc in _ENV_VARS:
+        val = env[var]
         if val:
             masked = val[:4] + "••••••••" + val[-2:] if len(val) > 6 else "••••"
             status = green("✓ SET")
             print(f"  {status}  {var:<20} {dim(masked)}")
         else:
             if level == "required":
-                status = red("✗ MISSING")
+                status = _MISS
                 all_required_ok = False
             else:
                 status = yellow("○ not set")
@@ -84,43 +108,77 @@ def check_dependencies():
     """Check all required Python packages are installed."""
     print(f"\n{bold('━━━ Dependencies ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━')}")
 
+    # (import name, pip distribution name, level)
     packages = [
-        ("requests",         "required"),
-        ("bs4",              "required"),
-        ("lxml",             "required"),
-        ("yaml",             "required"),
-        ("apscheduler",      "required"),
-        ("playwright",       "required"),
-        ("dotenv",           "required"),
-        ("cloudscraper",     "optional"),
+        ("requests",         "requests",        "required"),
+        ("bs4",              "beautifulsoup4",  "required"),
+        ("lxml",             "lxml",            "required"),
+        ("yaml",             "PyYAML",          "required"),
+        ("apscheduler",      "APScheduler",     "required"),
+        ("playwright",       "playwright",      "required"),
+        ("dotenv",           "python-dotenv",   "required"),
+        ("cloudscraper",     "cloudscraper",    "optional"),
+        ("curl_cffi",        "curl_cffi",       "optional"),
     ]
 
+    # Installed-distribution metadata is enough – no package code is executed
     all_ok = True
-    for pkg, level in packages:
+    for pkg, dist, level in packages:
         try:
-            __import__(pkg)
-            print(f"  {green('✓')} {pkg}")
-        except ImportError:
+            distribution(dist)
+            print(f"  {_OK} {pkg}")
+        except PackageNotFoundError:
             if level == "required":
-                print(f"  {red('✗')} {pkg}  {red('← pip install ' + pkg)}")
+                print(f"  {_FAIL} {pkg}  {red('← pip install ' + dist)}")
                 all_ok = False
             else:
-                print(f"  {yellow('○')} {pkg}  {dim('(optional)')}")
+                print(f"  {_SKIP} {pkg}  {dim('(optional)')}")
 
-    # Special check for Playwright browsers
+    # PyYAML without libyaml falls back to the (much slower) pure-Python parser
+    try:
+        from yaml import CSafeLoader  # noqa: F401
+        print(f"  {_OK} libyaml {dim('(fast YAML parser)')}")
+    except ImportError:
+        print(f"  {_SKIP} libyaml  {dim('(optional – pure-Python YAML parser in use)')}")
+
+    # Special check for Playwright browsers (needs the real runtime)
+    if importlib.util.find_spec("playwright") is None:
+        return False
     try:
         from playwright.sync_api import sync_playwright
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             browser.close()
-        print(f"  {green('✓')} playwright chromium browser")
+        print(f"  {_OK} playwright chromium browser")
     except Exception as e:
-        print(f"  {red('✗')} playwright chromium browser  {red('← run: playwright install chromium')}")
+        print(f"  {_FAIL} playwright chromium browser  {red('← run: playwright install chromium')}")
         all_ok = False
 
     return all_ok
 
 
+# name → (module path, class name). Modules are imported only when the
+# scraper is actually tested, so `--scraper X` skips the other imports.
+SCRAPER_REGISTRY = {
+    "indeed":      ("scrapers.indeed_scraper",      "IndeedScraper"),
+    "linkedin":    ("scrapers.linkedin_scraper",    "LinkedInScraper"),
+    "simplify":    ("scrapers.simplify_scraper",    "SimplifyScraper"),
+    "handshake":   ("scrapers.handshake_scraper",   "HandshakeScraper"),
+    "google_jobs": ("scrapers.google_jobs_scraper", "GoogleJobsScraper"),
+}
+
+
+def _resolve_scraper(name):
+    """Import the scraper module for `name` and return its class."""
+    module_path, cls_name = SCRAPER_REGISTRY[name]
+    return getattr(importlib.import_module(module_path), cls_name)
+
+
+def _short_trace(exc, limit=8):
+    """Format `exc` with at most `limit` frames (Playwright stacks run deep)."""
+    return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__, limit=limit))
+
+
 def test_scraper(name, scraper_cls, config, keyword, location):
     """Run a single scraper and return a result dict."""
     result = {
@@ -138,78 +196,145 @@ def test_scraper(name, scraper_cls, config, keyword, location):
         jobs    = scraper.safe_search(keyword, location)
         scraper.cleanup()
 
-        result["duration"] = round(time.time() - start, 1)
+        result["duration"] = time.time() - start
         result["count"]    = len(jobs)
         result["status"]   = "ok" if jobs else "empty"
         result["sample"]   = jobs[:2]   # show first 2 as proof
 
     except Exception as e:
-        result["duration"] = round(time.time() - start, 1)
+        result["duration"] = time.time() - start
         result["status"]   = "error"
         result["error"]    = str(e)
-        result["trace"]    = traceback.format_exc()
+        result["trace"]    = _short_trace(e)
 
     return result
 
 
+def _fmt_line(result):
+    """Return the one-line status summary for a test result."""
+    name = bold(result["name"])
+    secs = dim(f"{result['duration']:.1f}s")
+    if result["status"] == "ok":
+        count = green(f"{result['count']} jobs")
+        return f"  {_OK} {name:<15} {count}  {secs}"
+    if result["status"] == "empty":
+        return (f"  {_SKIP} {name:<15} {yellow('0 jobs')}  {secs}  "
+                f"{yellow('← try different keyword/location')}")
+    return f"  {_FAIL} {name:<15} {red('ERROR')}  {secs}"
+
+
+def _print_result(result):
+    """Print the status line (plus samples / error) for a test result."""
+    print(_fmt_line(result))
+    if result["status"] == "ok":
+        # safe_search yields Job objects, but a scraper's samples are all one
+        # type, so decide between attribute and dict access just once.
+        sample = result["sample"]
+        field  = getattr if hasattr(sample[0], "title") else (lambda j, k: j.get(k, ""))
+        arrow, bar = dim("→"), dim("|")
+        for j in sample:
+            print(f"       {arrow} {field(j, 'title')[:45]}  {bar}  {field(j, 'company')[:20]}")
+    elif result["status"] == "error":
+        print(f"       {red(result['error'])}")
+
+
 def run_scraper_tests(config, keyword, location, only=None):
     """Test all enabled scrapers (or just one if --scraper is set)."""
-    from scrapers.indeed_scraper      import IndeedScraper
-    from scrapers.linkedin_scraper    import LinkedInScraper
-    from scrapers.simplify_scraper    import SimplifyScraper
-    from scrapers.handshake_scraper   import HandshakeScraper
-    from scrapers.google_jobs_scraper import GoogleJobsScraper
-
-    registry = {
-        "indeed":      IndeedScraper,
-        "linkedin":    LinkedInScraper,
-        "simplify":    SimplifyScraper,
-        "handshake":   HandshakeScraper,
-        "google_jobs": GoogleJobsScraper,
-    }
+    try:
+        return _run_scraper_tests(config, keyword, location, only)
+    finally:
+        # Stop the HTML parse workers, if any scraper started them
+        base = sys.modules.get("scrapers.base_scraper")
+        if base is not None:
+            base.shutdown_parse_pool()
 
-    enabled = config.get("scrapers", {}).get("enabled", list(registry))
+
+def _run_scraper_tests(config, keyword, location, only):
+    enabled = config.get("scrapers", {}).get("enabled", list(SCRAPER_REGISTRY))
     if only:
-        enabled = [only] if only in registry else []
+        enabled = [only] if only in SCRAPER_REGISTRY else []
         if not enabled:
-            print(red(f"Unknown scraper '{only}'. Choose from: {list(registry.keys())}"))
+            print(red(f"Unknown scraper '{only}'. Choose from: {list(SCRAPER_REGISTRY.keys())}"))
             sys.exit(1)
 
     print(f"\n{bold('━━━ Scraper Tests ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━')}")
     print(f"  {dim('Keyword:')}  {keyword}")
     print(f"  {dim('Location:')} {location}\n")
 
+    if only:
+        # Single scraper: import just that module and run it inline –
+        # no lanes, no thread pool, no shared browser to set up.
+        print(f"  {cyan('⟳')} Testing {bold(only)}...\n", flush=True)
+        try:
+            result = test_scraper(only, _resolve_scraper(only), config, keyword, location)
+        except Exception as e:
+            result = {
+                "name": only, "status": "error", "count": 0, "duration": 0,
+                "error": f"{type(e).__name__}: {e}", "sample": [],
+                "trace": _short_trace(e),
+            }
+        finally:
+            from scrapers.browser_pool import close_browser
+            close_browser()
+        _print_result(result)
+        return [result]
+
+    names = [n for n in enabled if n in SCRAPER_REGISTRY]
+    if not names:
+        return []
+
     results = []
-    for name in enabled:
-        cls = registry.get(name)
-        if not cls:
+    lanes   = []          # each lane is a list of (name, cls) run in order
+    browser_lane = []
+    for name in names:
+        try:
+            cls = _resolve_scraper(name)
+        except Exception as e:
+            # A broken scraper module must not stop the others from being tested
+            results.append({
+                "name": name, "status": "error", "count": 0, "duration": 0,
+                "error": f"{type(e).__name__}: {e}", "sample": [],
+                "trace": _short_trace(e),
+            })
             continue
-        print(f"  {cyan('⟳')} Testing {bold(name)}...", end="", flush=True)
-        result = test_scraper(name, cls, config, keyword, location)
-        results.append(result)
-
-        # Print inline result
-        if result["status"] == "ok":
-            print(f"\r  {green('✓')} {bold(name):<15} "
-                  f"{green(str(result['count']) + ' jobs')}  "
-                  f"{dim(str(result['duration']) + 's')}")
-            for j in result["sample"]:
-                title   = j.title[:45] if hasattr(j, 'title') else j.get('title','')[:45]
-                company = j.company[:20] if hasattr(j, 'company') else j.get('company','')[:20]
-                print(f"       {dim('→')} {title}  {dim('|')}  {company}")
-
-        elif result["status"] == "empty":
-            print(f"\r  {yellow('○')} {bold(name):<15} "
-                  f"{yellow('0 jobs')}  "
-                  f"{dim(str(result['duration']) + 's')}  "
-                  f"{yellow('← try different keyword/location')}")
-
+        if getattr(cls, "USES_BROWSER", False):
+            browser_lane.append((name, cls))
         else:
-            print(f"\r  {red('✗')} {bold(name):<15} "
-                  f"{red('ERROR')}  "
-                  f"{dim(str(result['duration']) + 's')}")
-            print(f"       {red(result['error'])}")
-
+            lanes.append([(name, cls)])
+    if browser_lane:
+        lanes.append(browser_lane)
+
+    def _run_lane(lane):
+        if lane is not browser_lane:
+            return [test_scraper(n, c, config, keyword, location) for n, c in lane]
+        # Playwright-backed scrapers share one Chromium (browser_pool keeps
+        # one per thread). Sync Playwright objects are bound to the thread
+        # that created them, so these run one after another inside this lane.
+        from scrapers.browser_pool import close_browser
+        try:
+            return [test_scraper(n, c, config, keyword, location) for n, c in lane]
+        finally:
+            close_browser()
+
+    for result in results:
+        _print_result(result)
+
+    # Scrapers are network-bound, so running the lanes side by side makes
+    # the total wall time roughly that of the slowest lane.
+    if lanes:
+        with ThreadPoolExecutor(max_workers=len(lanes)) as ex:
+            futures = []
+            for lane in lanes:
+                for name, _ in lane:
+                    print(f"  {cyan('⟳')} Testing {bold(name)}...", flush=True)
+                futures.append(ex.submit(_run_lane, lane))
+            print()
+            for fut in as_completed(futures):
+                for result in fut.result():
+                    results.append(result)
+                    _print_result(result)
+
+    results.sort(key=lambda r: names.index(r["name"]))
     return results
 
 
@@ -264,6 +389,10 @@ def main():
 
     config = load_config()
 
+    # Deferred until here so --help never touches the filesystem for .env
+    from dotenv import load_dotenv
+    load_dotenv()
+
     env_ok  = check_env_vars()  if not args.skip_env  else True
     deps_ok = check_dependencies() if not args.skip_deps else True
 
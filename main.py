@@ -17,21 +17,26 @@ Usage:
 
 import argparse
 import logging
-import logging.handlers
 import os
 import sys
-from pathlib import Path
-
-import yaml
-from dotenv import load_dotenv
-load_dotenv()
 
 
 # ──────────────────────────────────────────────────────────────────
 # Logging setup (must happen before importing scrapers)
 # ──────────────────────────────────────────────────────────────────
 
+_CONSOLE_FMT = logging.Formatter(
+    "%(asctime)s  %(levelname)-8s  %(name)s – %(message)s",
+    datefmt="%H:%M:%S",
+)
+_FILE_FMT = logging.Formatter(
+    "%(asctime)s %(levelname)-8s %(name)s – %(message)s"
+)
+
+
 def _setup_logging(config: dict) -> None:
+    import logging.handlers
+
     log_cfg   = config.get("logging", {})
     level_str = log_cfg.get("level", "INFO").upper()
     level     = getattr(logging, level_str, logging.INFO)
@@ -47,10 +52,7 @@ def _setup_logging(config: dict) -> None:
     # Console handler
     ch = logging.StreamHandler(sys.stdout)
     ch.setLevel(level)
-    ch.setFormatter(logging.Formatter(
-        "%(asctime)s  %(levelname)-8s  %(name)s – %(message)s",
-        datefmt="%H:%M:%S",
-    ))
+    ch.setFormatter(_CONSOLE_FMT)
     root.addHandler(ch)
 
     # Rotating file handler
@@ -58,9 +60,7 @@ def _setup_logging(config: dict) -> None:
         log_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
     )
     fh.setLevel(level)
-    fh.setFormatter(logging.Formatter(
-        "%(asctime)s %(levelname)-8s %(name)s – %(message)s"
-    ))
+    fh.setFormatter(_FILE_FMT)
     root.addHandler(fh)
 
     # Quiet noisy third-party loggers
@@ -71,16 +71,24 @@ def _setup_logging(config: dict) -> None:
 logger = logging.getLogger(__name__)
 
 
+def _load_env() -> None:
+    """Load .env into os.environ – only needed by commands that read secrets."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
 # ──────────────────────────────────────────────────────────────────
 # Config loader
 # ──────────────────────────────────────────────────────────────────
 
 def _load_config(path: str = "config.yaml") -> dict:
-    if not Path(path).exists():
+    from storage.yaml_cache import load_yaml
+    # load_yaml's own stat doubles as the existence check
+    try:
+        return load_yaml(path)
+    except FileNotFoundError:
         sys.exit(f"[ERROR] config.yaml not found at '{path}'. "
                  "Copy config.yaml to the project root and edit it.")
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -155,6 +163,7 @@ def _handle_test_email(config: dict) -> None:
     from notifier.email_notifier import EmailNotifier
     notifier = EmailNotifier(config)
     ok = notifier.test()
+    notifier.close()
     if ok:
         print("✅  Test email sent successfully.")
     else:
@@ -200,9 +209,10 @@ def _handle_list_config(config: dict) -> None:
 
 
 def _handle_list_jobs(config: dict, n: int) -> None:
+    from itertools import islice
     from storage.database import Database
     db   = Database(config.get("storage", {}).get("db_path", "storage/jobs.db"))
-    jobs = db.get_unnotified_jobs()[:n]
+    jobs = list(islice(db.iter_unnotified_jobs(), n))
     if not jobs:
         print("No unseen jobs in the database yet. Run the scraper first.")
         sys.exit(0)
@@ -224,19 +234,59 @@ def _handle_list_jobs(config: dict, n: int) -> None:
 
 
 def _handle_export_csv(config: dict) -> None:
-    from scheduler import JobScheduler
-    js   = JobScheduler(config)
-    jobs = js.db.get_unnotified_jobs()
-    js._export_csv(jobs)
+    # Only the DB and the CSV writer are needed – skip building scrapers/notifiers
+    from scheduler import export_csv
+    from storage.database import Database
+    db   = Database(config.get("storage", {}).get("db_path", "storage/jobs.db"))
+    jobs = db.get_unnotified_jobs()
+    export_csv(config, jobs)
     print(f"✅  Exported {len(jobs)} jobs to CSV.")
     sys.exit(0)
 
 
+def _run_scheduler(config: dict, run_now: bool = False, dry_run: bool = False) -> None:
+    _load_env()     # SMTP / Telegram / LinkedIn / SerpAPI credentials
+    from scheduler import JobScheduler
+    job_scheduler = JobScheduler(config)
+
+    if run_now:
+        logger.info("Running once (--run-now)…")
+        new = job_scheduler.run_once(dry_run=False)
+        job_scheduler.cleanup()
+        print(f"\n✅  Done. {new} new job(s) found and notified.")
+        sys.exit(0)
+
+    if dry_run:
+        logger.info("Running once in dry-run mode (no notifications)…")
+        new = job_scheduler.run_once(dry_run=True)
+        job_scheduler.cleanup()
+        print(f"\n✅  Dry run done. {new} new job(s) found (not notified).")
+        sys.exit(0)
+
+    # Default: start the recurring scheduler
+    print(
+        f"\n🚀  Job Automation Tool started.\n"
+        f"    Interval : every {config.get('scheduler',{}).get('interval_hours',3)}h\n"
+        f"    Scrapers : {list(config.get('scrapers',{}).get('enabled',[]))}\n"
+        f"    Press Ctrl+C to stop.\n"
+    )
+    job_scheduler.start_scheduler()
+
+
 # ──────────────────────────────────────────────────────────────────
 # Entry point
 # ──────────────────────────────────────────────────────────────────
 
 def main() -> None:
+    # Fast path for the unattended invocations (service / cron): no flags
+    # beyond --run-now means there is nothing for argparse to do.
+    argv = sys.argv[1:]
+    if argv in ([], ["--run-now"]):
+        config = _load_config()
+        _setup_logging(config)
+        _run_scheduler(config, run_now=bool(argv))
+        return
+
     parser = _build_parser()
     args   = parser.parse_args()
     config = _load_config(args.config)
@@ -245,6 +295,7 @@ def main() -> None:
     # ── Quick commands (no scheduler needed) ──────────────────────
 
     if args.test_email:
+        _load_env()
         _handle_test_email(config)
 
     if args.add_keyword:
@@ -264,31 +315,7 @@ def main() -> None:
 
     # ── Scheduler / run commands ──────────────────────────────────
 
-    from scheduler import JobScheduler
-    job_scheduler = JobScheduler(config)
-
-    if args.run_now:
-        logger.info("Running once (--run-now)…")
-        new = job_scheduler.run_once(dry_run=False)
-        job_scheduler.cleanup()
-        print(f"\n✅  Done. {new} new job(s) found and notified.")
-        sys.exit(0)
-
-    if args.dry_run:
-        logger.info("Running once in dry-run mode (no notifications)…")
-        new = job_scheduler.run_once(dry_run=True)
-        job_scheduler.cleanup()
-        print(f"\n✅  Dry run done. {new} new job(s) found (not notified).")
-        sys.exit(0)
-
-    # Default: start the recurring scheduler
-    print(
-        f"\n🚀  Job Automation Tool started.\n"
-        f"    Interval : every {config.get('scheduler',{}).get('interval_hours',3)}h\n"
-        f"    Scrapers : {list(config.get('scrapers',{}).get('enabled',[]))}\n"
-        f"    Press Ctrl+C to stop.\n"
-    )
-    job_scheduler.start_scheduler()
+    _run_scheduler(config, run_now=args.run_now, dry_run=args.dry_run)
 
 
 if __name__ == "__main__":
@@ -18,13 +18,29 @@ import ssl
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Default TLS context, built (CA bundle parsed) once per process."""
+    return ssl.create_default_context()
+
+
 class EmailNotifier:
-    """Sends HTML job digest emails via SMTP (TLS)."""
+    """
+    Sends HTML job digest emails via SMTP (TLS).
+
+    The authenticated SMTP session is kept open between sends and
+    health-checked with RSET before reuse, so a scheduler cycle only pays
+    for TCP + STARTTLS + AUTH when the server has dropped the connection
+    (or after MAX_PER_CONN messages). Call close() on shutdown.
+    """
+
+    MAX_PER_CONN = 100     # recycle the session after this many messages
 
     def __init__(self, config: dict) -> None:
         email_cfg         = config.get("email", {})
@@ -34,6 +50,8 @@ class EmailNotifier:
         self.smtp_host    = email_cfg.get("smtp_host", "smtp.gmail.com")
         self.smtp_port    = int(email_cfg.get("smtp_port", 587))
         self.send_empty   = config.get("scheduler", {}).get("send_empty_email", False)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._sent_on_conn = 0
 
         if not self.sender:
             logger.warning("EMAIL_USER env var not set – emails will not send.")
@@ -59,9 +77,15 @@ class EmailNotifier:
             logger.info("No new jobs – skipping email.")
             return True
 
-        subject  = self._subject(len(jobs))
-        html     = self._build_html(jobs)
-        plain    = self._build_plain(jobs)
+        # Group and timestamp once; subject and both bodies share them
+        now      = datetime.utcnow()
+        subject  = self._subject(len(jobs), now)
+        if jobs:
+            groups = self._group_by_source(jobs)
+            html   = self._build_html(jobs, groups, now)
+            plain  = self._build_plain(jobs, groups, now)
+        else:
+            html, plain = self._build_empty(now)
 
         if dry_run:
             logger.info("DRY RUN – email not sent. Subject: %s", subject)
@@ -80,14 +104,32 @@ class EmailNotifier:
 
             msg.attach(MIMEText(plain, "plain"))
             msg.attach(MIMEText(html,  "html"))
-
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
-                server.ehlo()
-                server.starttls(context=context)
-                server.ehlo()
-                server.login(self.sender, self.password)
-                server.sendmail(self.sender, self.recipients, msg.as_string())
+            # Serialise once, with the CRLF line endings SMTP requires –
+            # data() only fixes up line endings for str, not bytes.
+            data = msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
+
+            for attempt in range(2):
+                server = self._get_conn()
+                try:
+                    self._envelope(server)
+                    break
+                except OSError as exc:
+                    # Refused by the server: resending won't help
+                    if (isinstance(exc, smtplib.SMTPException)
+                            and not isinstance(exc, smtplib.SMTPServerDisconnected)):
+                        raise
+                    # Connection died before DATA, so nothing was delivered –
+                    # retry once on a fresh connection
+                    self.close()
+                    if attempt:
+                        raise
+            # Never retried: once DATA starts the server may already have
+            # accepted the message, and a resend would deliver it twice.
+            code, resp = server.data(data)
+            if code != 250:
+                server.rset()
+                raise smtplib.SMTPDataError(code, resp)
+            self._sent_on_conn += 1
 
             logger.info(
                 "Email sent to %s — %d jobs in digest", self.recipients, len(jobs)
@@ -118,13 +160,87 @@ class EmailNotifier:
         }]
         return self.send(fake)
 
+    def close(self) -> None:
+        """QUIT the cached SMTP session, if any."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+    # ──────────────────────────────────────────────────────────────
+    # SMTP connection
+    # ──────────────────────────────────────────────────────────────
+
+    def _get_conn(self) -> smtplib.SMTP:
+        """Return a live, logged-in SMTP session, reconnecting if needed."""
+        if self._smtp is not None and self._sent_on_conn < self.MAX_PER_CONN:
+            try:
+                # RSET both proves the session is alive and clears any
+                # envelope left over from the previous transaction.
+                if self._smtp.rset()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+        self.close()
+
+        context = _ssl_context()
+        server  = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+        try:
+            server.ehlo()
+            server.starttls(context=context)
+            server.ehlo()
+            server.login(self.sender, self.password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp         = server
+        self._sent_on_conn = 0
+        return server
+
+    def _envelope(self, server: smtplib.SMTP) -> None:
+        """
+        Send MAIL FROM and every RCPT TO, ready for DATA. When the server
+        advertises PIPELINING (RFC 2920) they go out in a single write and
+        their replies are read afterwards, saving a round trip per recipient.
+        """
+        addrs = [self.sender, *self.recipients]
+        if not server.has_extn("pipelining") or not all(a.isascii() for a in addrs):
+            # One command at a time, as sendmail() would (including its
+            # SMTPUTF8 option for non-ASCII addresses)
+            server.ehlo_or_helo_if_needed()
+            options = [] if all(a.isascii() for a in addrs) else ["SMTPUTF8"]
+            if options and not server.has_extn("smtputf8"):
+                raise smtplib.SMTPNotSupportedError(
+                    "One or more source or delivery addresses require"
+                    " internationalized email support, but the server"
+                    " does not advertise the required SMTPUTF8 capability")
+            replies = [server.mail(self.sender, options)]
+            replies += [server.rcpt(r) for r in self.recipients]
+        else:
+            cmds = [f"mail FROM:{smtplib.quoteaddr(self.sender)}"]
+            cmds += [f"rcpt TO:{smtplib.quoteaddr(r)}" for r in self.recipients]
+            server.send("".join(c + "\r\n" for c in cmds))
+            replies = [server.getreply() for _ in cmds]
+
+        code, resp = replies[0]
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, self.sender)
+        refused = {r: rep for r, rep in zip(self.recipients, replies[1:])
+                   if rep[0] not in (250, 251)}
+        if len(refused) == len(self.recipients):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
     # ──────────────────────────────────────────────────────────────
     # Email builders
     # ──────────────────────────────────────────────────────────────
 
     @staticmethod
-    def _subject(count: int) -> str:
-        ts = datetime.utcnow().strftime("%b %d, %Y %H:%M UTC")
+    def _subject(count: int, now: datetime) -> str:
+        ts = now.strftime("%b %d, %Y %H:%M UTC")
         if count == 0:
             return f"🔎 Job Alert — No New Jobs Found ({ts})"
         return f"🚀 Job Alert — {count} New Job{'s' if count != 1 else ''} Found ({ts})"
@@ -140,58 +256,156 @@ class EmailNotifier:
             groups[src].sort(key=lambda x: x.get("score", 0), reverse=True)
         return groups
 
-    def _build_html(self, jobs: List[Dict]) -> str:
-        groups = self._group_by_source(jobs)
-        ts     = datetime.utcnow().strftime("%B %d, %Y at %H:%M UTC")
+    def _build_html(self, jobs: List[Dict], groups: Dict[str, List[Dict]],
+                    now: datetime) -> str:
+        ts = now.strftime("%B %d, %Y at %H:%M UTC")
 
-        sections = ""
+        sections: List[str] = []
         for source, source_jobs in groups.items():
-            cards = ""
-            for j in source_jobs:
-                score_bar = "▓" * int(j.get("score", 0) / 10) + "░" * (10 - int(j.get("score", 0) / 10))
-                cards += f"""
+            # Pull each field out once, column by column, then render by zip
+            urls      = [j.get("url", "#")       for j in source_jobs]
+            titles    = [j.get("title", "")      for j in source_jobs]
+            companies = [j.get("company", "")    for j in source_jobs]
+            locations = [j.get("location", "")   for j in source_jobs]
+            posted    = [j.get("date_posted")    for j in source_jobs]
+            descs     = [j.get("description")    for j in source_jobs]
+            scores    = [j.get("score", 0)       for j in source_jobs]
+
+            cards: List[str] = []
+            for url, title, company, location, date, desc, score in zip(
+                urls, titles, companies, locations, posted, descs, scores,
+            ):
+                filled = int(score / 10)
+                cards.append(_CARD_HTML(
+                    url=url,
+                    title=title,
+                    company=company,
+                    location=location,
+                    posted=_POSTED_HTML(date) if date else "",
+                    desc=_DESC_HTML(desc[:200]) if desc else "",
+                    score_bar="▓" * filled + "░" * (10 - filled),
+                    score=score,
+                ))
+            sections.append(_SECTION_HTML(
+                source=source,
+                count=len(source_jobs),
+                plural="s" if len(source_jobs) != 1 else "",
+                cards="".join(cards),
+            ))
+
+        return _PAGE_HTML(
+            count=len(jobs),
+            plural="s" if len(jobs) != 1 else "",
+            ts=ts,
+            sections="".join(sections),
+        )
+
+    @staticmethod
+    def _build_empty(now: datetime) -> Tuple[str, str]:
+        """(html, plain) for a "no new jobs" email – just the page shell."""
+        html  = _PAGE_HTML(count=0, plural="s",
+                           ts=now.strftime("%B %d, %Y at %H:%M UTC"),
+                           sections=_EMPTY_HTML)
+        plain = _EMPTY_PLAIN.format(now.strftime("%Y-%m-%d %H:%M UTC"))
+        return html, plain
+
+    @staticmethod
+    def _build_plain(jobs: List[Dict], groups: Dict[str, List[Dict]],
+                     now: datetime) -> str:
+        lines = [
+            f"Job Alert – {len(jobs)} New Jobs",
+            "=" * 50,
+            f"Generated: {now.strftime('%Y-%m-%d %H:%M UTC')}",
+            "",
+        ]
+        for src, src_jobs in groups.items():
+            lines.append(f"\n── {src} ({len(src_jobs)} jobs) ──")
+            for j in src_jobs:
+                posted = j.get("date_posted")
+                tpl    = _PLAIN_JOB_POSTED if posted else _PLAIN_JOB
+                lines.append(tpl(
+                    title=j.get("title", ""),
+                    company=j.get("company", ""),
+                    location=j.get("location", ""),
+                    posted=posted,
+                    score=j.get("score", 0),
+                    url=j.get("url", ""),
+                ))
+
+        return "\n".join(lines)
+
+
+# ──────────────────────────────────────────────────────────────────
+# HTML templates
+# ──────────────────────────────────────────────────────────────────
+# Parsed once at import: each bound str.format below fills its fields
+# by name, so a digest no longer re-evaluates the whole page literal
+# per card/section.
+
+_CARD_HTML = """
                 <div style="background:#fff;border:1px solid #e5e7eb;border-radius:10px;
                             padding:16px 20px;margin-bottom:14px;box-shadow:0 1px 3px rgba(0,0,0,.06);">
                   <div style="display:flex;justify-content:space-between;align-items:flex-start;">
                     <div>
-                      <a href="{j.get('url','#')}"
+                      <a href="{url}"
                          style="font-size:15px;font-weight:600;color:#1d4ed8;text-decoration:none;">
-                        {j.get('title','')}
+                        {title}
                       </a>
                       <div style="color:#374151;font-size:13px;margin-top:4px;">
-                        <strong>{j.get('company','')}</strong>
-                        &nbsp;·&nbsp;{j.get('location','')}
-                        {'&nbsp;·&nbsp;<span style="color:#6b7280">' + j.get('date_posted','') + '</span>' if j.get('date_posted') else ''}
+                        <strong>{company}</strong>
+                        &nbsp;·&nbsp;{location}
+                        {posted}
                       </div>
-                      {('<div style="color:#4b5563;font-size:12px;margin-top:6px;line-height:1.5;">'
-                         + j.get('description','')[:200] + '…</div>') if j.get('description') else ''}
+                      {desc}
                     </div>
                     <div style="text-align:right;min-width:90px;margin-left:12px;">
                       <span style="font-size:11px;color:#6b7280;">Relevance</span><br>
                       <span style="font-family:monospace;font-size:11px;color:#10b981;">{score_bar}</span><br>
-                      <span style="font-size:13px;font-weight:700;color:#10b981;">{j.get('score',0):.0f}/100</span>
+                      <span style="font-size:13px;font-weight:700;color:#10b981;">{score:.0f}/100</span>
                     </div>
                   </div>
                   <div style="margin-top:10px;">
-                    <a href="{j.get('url','#')}"
+                    <a href="{url}"
                        style="display:inline-block;padding:6px 14px;background:#1d4ed8;
                               color:#fff;border-radius:6px;font-size:12px;text-decoration:none;">
                       Apply →
                     </a>
                   </div>
                 </div>
-                """
-            sections += f"""
+                """.format
+
+_POSTED_HTML = '&nbsp;·&nbsp;<span style="color:#6b7280">{}</span>'.format
+_DESC_HTML   = '<div style="color:#4b5563;font-size:12px;margin-top:6px;line-height:1.5;">{}…</div>'.format
+
+_SECTION_HTML = """
             <div style="margin-bottom:32px;">
               <h2 style="font-size:17px;font-weight:700;color:#111827;margin:0 0 12px;
                          padding-bottom:6px;border-bottom:2px solid #e5e7eb;">
-                {source} <span style="font-weight:400;color:#6b7280;">({len(source_jobs)} job{'s' if len(source_jobs)!=1 else ''})</span>
+                {source} <span style="font-weight:400;color:#6b7280;">({count} job{plural})</span>
               </h2>
               {cards}
             </div>
-            """
-
-        body = f"""
+            """.format
+
+# One plain-text entry per job (joined into the body with "\n")
+_PLAIN_JOB = (
+    "\n  Title:   {title}"
+    "\n  Company: {company} · {location}"
+    "\n  Score:   {score:.0f}/100"
+    "\n  Link:    {url}"
+).format
+_PLAIN_JOB_POSTED = (
+    "\n  Title:   {title}"
+    "\n  Company: {company} · {location}"
+    "\n  Posted:  {posted}"
+    "\n  Score:   {score:.0f}/100"
+    "\n  Link:    {url}"
+).format
+
+_EMPTY_HTML  = '<p style="color:#6b7280;text-align:center;">No new jobs found this run.</p>'
+_EMPTY_PLAIN = "Job Alert – 0 New Jobs\n" + "=" * 50 + "\nGenerated: {}\n\nNo new jobs found this run."
+
+_PAGE_HTML = """
         <!DOCTYPE html>
         <html>
         <head><meta charset="UTF-8"></head>
@@ -203,12 +417,12 @@ class EmailNotifier:
                         padding:28px 32px;color:#fff;margin-bottom:28px;">
               <div style="font-size:24px;font-weight:800;margin-bottom:4px;">🚀 Job Alert</div>
               <div style="font-size:14px;opacity:.85;">
-                {len(jobs)} new listing{'s' if len(jobs)!=1 else ''} found &nbsp;·&nbsp; {ts}
+                {count} new listing{plural} found &nbsp;·&nbsp; {ts}
               </div>
             </div>
 
             <!-- Sections by source -->
-            {sections if jobs else '<p style="color:#6b7280;text-align:center;">No new jobs found this run.</p>'}
+            {sections}
 
             <!-- Footer -->
             <div style="text-align:center;color:#9ca3af;font-size:11px;margin-top:32px;padding-bottom:24px;">
@@ -218,33 +432,4 @@ class EmailNotifier:
           </div>
         </body>
         </html>
-        """
-        return body
-
-    @staticmethod
-    def _build_plain(jobs: List[Dict]) -> str:
-        lines = [
-            f"Job Alert – {len(jobs)} New Jobs",
-            "=" * 50,
-            f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
-            "",
-        ]
-        groups: Dict[str, List] = {}
-        for j in jobs:
-            src = j.get("source", "unknown").capitalize()
-            groups.setdefault(src, []).append(j)
-
-        for src, src_jobs in groups.items():
-            lines.append(f"\n── {src} ({len(src_jobs)} jobs) ──")
-            for j in src_jobs:
-                lines.append(f"\n  Title:   {j.get('title','')}")
-                lines.append(f"  Company: {j.get('company','')} · {j.get('location','')}")
-                if j.get("date_posted"):
-                    lines.append(f"  Posted:  {j.get('date_posted')}")
-                lines.append(f"  Score:   {j.get('score', 0):.0f}/100")
-                lines.append(f"  Link:    {j.get('url','')}")
-
-        if not jobs:
-            lines.append("No new jobs found this run.")
-
-        return "\n".join(lines)
+        """.format
@@ -16,11 +16,16 @@ import logging
 import os
 from typing import Any, Dict, List
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from scrapers.base_scraper import BaseScraper  # reuse rate-limited _get/_post
 
 logger = logging.getLogger(__name__)
 
 _BASE = "https://api.telegram.org/bot{token}"
+_MAX_MESSAGE_LEN = 4096     # Telegram's sendMessage text limit
+_SEP             = "\n\n"    # between jobs in a digest message
 
 
 class TelegramNotifier:
@@ -31,6 +36,13 @@ class TelegramNotifier:
         self.chat_id  = os.environ.get("TELEGRAM_CHAT_ID", "")
         self._base    = _BASE.format(token=self.token)
 
+        # One keep-alive session: every sendMessage reuses the same TLS
+        # connection to api.telegram.org instead of handshaking per job.
+        self._session = None
+        if self.enabled:
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
         if self.enabled and (not self.token or not self.chat_id):
             logger.warning(
                 "Telegram enabled but TELEGRAM_TOKEN or TELEGRAM_CHAT_ID not set."
@@ -44,52 +56,88 @@ class TelegramNotifier:
         if not jobs:
             return True
 
-        import requests
-
-        # Send a brief message per job (batch up to 10 to avoid spam)
-        for job in jobs[:10]:
-            text = (
-                f"🚀 *{_esc(job.get('title',''))}*\n"
-                f"🏢 {_esc(job.get('company',''))} · {_esc(job.get('location',''))}\n"
-                f"📅 {_esc(job.get('date_posted',''))}\n"
-                f"⭐ Relevance: {job.get('score',0):.0f}/100\n"
-                f"🔗 [Apply Here]({job.get('url','#')})"
+        # One digest message (split only if it would exceed Telegram's
+        # length limit) instead of a sendMessage round trip per job.
+        entries = [_fmt_job(job) for job in jobs[:10]]
+        if len(jobs) > 10:
+            entries.append(
+                f"_…and {len(jobs) - 10} more jobs\\. Check your email for the full digest\\._"
             )
-            try:
-                resp = requests.post(
-                    f"{self._base}/sendMessage",
-                    json={
-                        "chat_id":    self.chat_id,
-                        "text":       text,
-                        "parse_mode": "MarkdownV2",
-                        "disable_web_page_preview": False,
-                    },
-                    timeout=10,
-                )
-                if not resp.ok:
-                    logger.warning("Telegram send failed: %s", resp.text)
-            except Exception as exc:
-                logger.error("Telegram error: %s", exc)
 
-        if len(jobs) > 10:
-            try:
-                requests.post(
-                    f"{self._base}/sendMessage",
-                    json={
-                        "chat_id": self.chat_id,
-                        "text":    f"_…and {len(jobs) - 10} more jobs\\. Check your email for the full digest\\._",
-                        "parse_mode": "MarkdownV2",
-                    },
-                    timeout=10,
-                )
-            except Exception:
-                pass
+        for group in _pack(entries, len(_SEP), _MAX_MESSAGE_LEN):
+            if self._post(_SEP.join(group)) or len(group) == 1:
+                continue
+            # One entry Telegram rejects (a bad escape, an over-long field)
+            # fails the whole message – resend it one job at a time so only
+            # that job is lost.
+            logger.warning("Telegram: retrying %d jobs one message each", len(group))
+            for entry in group:
+                self._post(entry)
 
         logger.info("Telegram: sent %d job notifications", min(len(jobs), 10))
         return True
 
+    def _post(self, text: str) -> bool:
+        """sendMessage `text` as MarkdownV2; False (and logged) on failure."""
+        try:
+            resp = self._session.post(
+                f"{self._base}/sendMessage",
+                json={
+                    "chat_id":    self.chat_id,
+                    "text":       text,
+                    "parse_mode": "MarkdownV2",
+                    "disable_web_page_preview": False,
+                },
+                timeout=10,
+            )
+            if resp.ok:
+                return True
+            logger.warning("Telegram send failed: %s\nMessage was:\n%s", resp.text, text)
+        except Exception as exc:
+            logger.error("Telegram error: %s", exc)
+        return False
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+def _fmt_job(job: Dict[str, Any]) -> str:
+    return (
+        f"🚀 *{_esc(job.get('title',''))}*\n"
+        f"🏢 {_esc(job.get('company',''))} · {_esc(job.get('location',''))}\n"
+        f"📅 {_esc(job.get('date_posted',''))}\n"
+        f"⭐ Relevance: {job.get('score',0):.0f}/100\n"
+        f"🔗 [Apply Here]({job.get('url','#')})"
+    )
+
+
+def _pack(parts: List[str], sep_len: int, limit: int) -> List[List[str]]:
+    """
+    Group `parts` into as few messages as possible, each at most `limit`
+    chars once joined with a separator of `sep_len` chars.
+    """
+    groups: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for part in parts:
+        extra = len(part) + (sep_len if current else 0)
+        if current and size + extra > limit:
+            groups.append(current)
+            current, size = [], 0
+            extra = len(part)
+        current.append(part)
+        size += extra
+    if current:
+        groups.append(current)
+    return groups
+
+
+# MarkdownV2 reserved character → backslash-escaped form
+_ESC_TABLE = {ord(c): "\\" + c for c in r"\_*[]()~`>#+-=|{}.!"}
+
 
 def _esc(text: str) -> str:
     """Escape special MarkdownV2 characters."""
-    special = r"\_*[]()~`>#+-=|{}.!"
-    return "".join(f"\\{c}" if c in special else c for c in str(text))
+    return str(text).translate(_ESC_TABLE)
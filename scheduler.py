@@ -5,7 +5,7 @@ Orchestrates a full scrape → dedup → notify cycle and repeats
 it on a configurable interval using APScheduler.
 
 Flow per run:
-  1. For each enabled scraper:
+  1. For each enabled scraper (scrapers run in parallel, one lane each):
        For each keyword × location pair:
          Collect jobs → filter duplicates → score → save
   2. Fetch all unseen (un-notified) jobs from DB
@@ -15,36 +15,46 @@ Flow per run:
 """
 
 import csv
+import importlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set, TextIO, Tuple
 
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-
-from scrapers.base_scraper import Job
-from scrapers.indeed_scraper import IndeedScraper
-from scrapers.linkedin_scraper import LinkedInScraper
-from scrapers.simplify_scraper import SimplifyScraper
-from scrapers.handshake_scraper import HandshakeScraper
-from scrapers.google_jobs_scraper import GoogleJobsScraper
+from scrapers.base_scraper import Job, shutdown_parse_pool
+from scrapers.browser_pool import close_browser
 from notifier.email_notifier import EmailNotifier
 from notifier.telegram_notifier import TelegramNotifier
 from storage.database import Database
 
 logger = logging.getLogger(__name__)
 
-# Map config name → scraper class
+# Map config name → (module path, class name). Scraper modules are only
+# imported when enabled, so disabled scrapers cost nothing at start-up.
 SCRAPER_REGISTRY = {
-    "indeed":      IndeedScraper,
-    "linkedin":    LinkedInScraper,
-    "simplify":    SimplifyScraper,
-    "handshake":   HandshakeScraper,
-    "google_jobs": GoogleJobsScraper,
+    "indeed":      ("scrapers.indeed_scraper",      "IndeedScraper"),
+    "linkedin":    ("scrapers.linkedin_scraper",    "LinkedInScraper"),
+    "simplify":    ("scrapers.simplify_scraper",    "SimplifyScraper"),
+    "handshake":   ("scrapers.handshake_scraper",   "HandshakeScraper"),
+    "google_jobs": ("scrapers.google_jobs_scraper", "GoogleJobsScraper"),
 }
 
 
+def _unique(terms: List[str]) -> List[str]:
+    """
+    Strip and de-duplicate search terms case-insensitively, keeping the
+    first spelling and the config order. Job boards treat "ML Engineer"
+    and "ml engineer" as the same query, so only one is dispatched.
+    """
+    seen: Dict[str, str] = {}
+    for term in terms:
+        term = term.strip()
+        if term and term.lower() not in seen:
+            seen[term.lower()] = term
+    return list(seen.values())
+
+
 class JobScheduler:
     """
     Manages the APScheduler loop and one-shot execution.
@@ -58,6 +68,27 @@ class JobScheduler:
         self.telegram      = TelegramNotifier(config)
         self._scrapers     = self._init_scrapers()
         self._apscheduler  = None
+        self._csv          = None    # (file, DictWriter), opened on first export
+
+        # One single-thread lane per scraper. Scrapers run side by side,
+        # while each one's queries stay sequential (its rate limit still
+        # applies) and always on the same thread – sync Playwright objects
+        # cannot be used from any thread other than the one that made them.
+        # With scrapers.share_browser the Playwright scrapers share one lane
+        # instead, and so one Chromium (see scrapers/browser_pool.py): less
+        # memory, but those scrapers then run one after another.
+        share_browser = self.config.get("scrapers", {}).get("share_browser", False)
+        browser_lane  = None
+        self._lanes   = {}
+        for name, scraper in self._scrapers.items():
+            if share_browser and scraper.USES_BROWSER:
+                if browser_lane is None:
+                    browser_lane = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrape-browser")
+                self._lanes[name] = browser_lane
+            else:
+                self._lanes[name] = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"scrape-{name}"
+                )
 
     # ──────────────────────────────────────────────────────────────
     # Scraper initialisation
@@ -67,11 +98,13 @@ class JobScheduler:
         enabled = self.config.get("scrapers", {}).get("enabled", list(SCRAPER_REGISTRY))
         scrapers = {}
         for name in enabled:
-            cls = SCRAPER_REGISTRY.get(name.lower())
-            if cls is None:
+            entry = SCRAPER_REGISTRY.get(name.lower())
+            if entry is None:
                 logger.warning("Unknown scraper '%s' in config – skipped", name)
                 continue
             try:
+                module_path, cls_name = entry
+                cls = getattr(importlib.import_module(module_path), cls_name)
                 scrapers[name] = cls(self.config)
                 logger.info("Loaded scraper: %s", name)
             except Exception as exc:
@@ -98,22 +131,50 @@ class JobScheduler:
 
         search_cfg   = self.config.get("search", {})
         keywords     = self._effective_keywords()
-        locations    = search_cfg.get("locations", ["Remote"])
+        locations    = _unique(search_cfg.get("locations", ["Remote"]))
         new_count    = 0
 
+        futures = {}
         for scraper_name, scraper in self._scrapers.items():
+            lane = self._lanes[scraper_name]
             for keyword in keywords:
                 for location in locations:
-                    logger.info(
-                        "Scraping %s | keyword='%s' | location='%s'",
-                        scraper_name, keyword, location,
-                    )
-                    jobs: List[Job] = scraper.safe_search(keyword, location)
+                    fut = lane.submit(self._search, scraper_name, scraper, keyword, location)
+                    futures[fut] = scraper_name
 
-                    for job in jobs:
-                        if self.db.is_new(job.url, job.title, job.company):
-                            self.db.save_job(job.to_dict())
-                            new_count += 1
+        # Per scraper: queries done, jobs found, and the fresh listings
+        # waiting to be saved – written and summarised once its last query
+        # finishes rather than per query.
+        combos  = len(keywords) * len(locations)
+        done    = {name: 0 for name in self._scrapers}
+        found   = {name: 0 for name in self._scrapers}
+        pending: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self._scrapers}
+
+        # Listings returned by several queries / scrapers this run are only
+        # handed to the DB once (same identity as the DB's fingerprint).
+        seen: Set[Tuple[str, str, str]] = set()
+
+        # DB writes stay on this thread, so SQLite never sees concurrent
+        # writers; each scraper's results go in as one transaction.
+        for fut in as_completed(futures):
+            scraper_name    = futures[fut]
+            jobs: List[Job] = fut.result()
+            for job in jobs:
+                key = (job.url.strip().lower(), job.title.strip().lower(),
+                       job.company.strip().lower())
+                if key not in seen:
+                    seen.add(key)
+                    pending[scraper_name].append(job.to_dict())
+            done[scraper_name]  += 1
+            found[scraper_name] += len(jobs)
+
+            if done[scraper_name] == combos:
+                added = self.db.save_jobs_bulk(pending.pop(scraper_name))
+                new_count += added
+                logger.info(
+                    "Scraper %s: %d combinations, %d jobs, %d new",
+                    scraper_name, combos, found[scraper_name], added,
+                )
 
         logger.info("New jobs this run: %d", new_count)
 
@@ -135,6 +196,14 @@ class JobScheduler:
         logger.info("Run #%d finished. Total jobs in DB: %d", run_id, self.db.total_jobs())
         return new_count
 
+    @staticmethod
+    def _search(scraper_name: str, scraper, keyword: str, location: str) -> List[Job]:
+        logger.debug(
+            "Scraping %s | keyword='%s' | location='%s'",
+            scraper_name, keyword, location,
+        )
+        return scraper.safe_search(keyword, location)
+
     # ──────────────────────────────────────────────────────────────
     # Keyword resolution (config + DB overrides)
     # ──────────────────────────────────────────────────────────────
@@ -143,8 +212,7 @@ class JobScheduler:
         """Merge YAML keywords with any keywords added via CLI into DB."""
         yaml_kw = self.config.get("search", {}).get("keywords", [])
         db_kw   = self.db.list_keywords()
-        merged  = list({k.strip() for k in yaml_kw + db_kw if k.strip()})
-        return merged
+        return _unique(yaml_kw + db_kw)
 
     # ──────────────────────────────────────────────────────────────
     # Scheduling
@@ -152,6 +220,9 @@ class JobScheduler:
 
     def start_scheduler(self) -> None:
         """Block the main thread and run every X hours."""
+        from apscheduler.schedulers.blocking import BlockingScheduler
+        from apscheduler.triggers.interval import IntervalTrigger
+
         hours = float(self.config.get("scheduler", {}).get("interval_hours", 3))
         logger.info("Starting scheduler – running every %.1f hours", hours)
 
@@ -172,33 +243,74 @@ class JobScheduler:
             self.cleanup()
 
     def cleanup(self) -> None:
-        """Gracefully shut down all scrapers."""
-        for scraper in self._scrapers.values():
+        """Gracefully shut down all scrapers and notifier connections."""
+        for name, scraper in self._scrapers.items():
+            try:
+                # Browser handles must be closed on the thread that opened them
+                self._lanes[name].submit(scraper.cleanup).result()
+            except Exception:
+                pass
+        # Then each lane's shared browser (if it ever launched one)
+        for lane in set(self._lanes.values()):
             try:
-                scraper.cleanup()
+                lane.submit(close_browser).result()
             except Exception:
                 pass
+            lane.shutdown(wait=False)
+        shutdown_parse_pool()
+        self.email.close()
+        self.telegram.close()
+        self.db.close()
+        if self._csv is not None:
+            self._csv[0].close()
+            self._csv = None
 
     # ──────────────────────────────────────────────────────────────
     # CSV export (bonus)
     # ──────────────────────────────────────────────────────────────
 
     def _export_csv(self, jobs: List[Dict[str, Any]]) -> None:
+        """Append to the export file, kept open across scheduled runs."""
         path = self.config.get("export", {}).get("csv_path", "exports/jobs_export.csv")
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        # Append mode so historical data accumulates
-        file_exists = os.path.isfile(path)
-        fieldnames  = [
-            "title", "company", "location", "url",
-            "date_posted", "source", "description", "score", "discovered",
-        ]
         try:
-            with open(path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-                if not file_exists:
-                    writer.writeheader()
-                writer.writerows(jobs)
+            if self._csv is None:
+                self._csv = _open_csv(path)
+            f, writer = self._csv
+            writer.writerows(jobs)
+            f.flush()
             logger.info("CSV export appended %d rows to %s", len(jobs), path)
         except Exception as exc:
             logger.error("CSV export failed: %s", exc)
+
+
+# ──────────────────────────────────────────────────────────────────
+# CSV export
+# ──────────────────────────────────────────────────────────────────
+
+_CSV_FIELDS = [
+    "title", "company", "location", "url",
+    "date_posted", "source", "description", "score", "discovered",
+]
+
+
+def _open_csv(path: str) -> Tuple[TextIO, csv.DictWriter]:
+    """Open `path` for appending; a new (empty) file gets the header row."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Append mode so historical data accumulates
+    f = open(path, "a", newline="", encoding="utf-8")
+    writer = csv.DictWriter(f, fieldnames=_CSV_FIELDS, extrasaction="ignore")
+    if f.tell() == 0:
+        writer.writeheader()
+    return f, writer
+
+
+def export_csv(config: dict, jobs: List[Dict[str, Any]]) -> None:
+    """Append `jobs` to the configured CSV export file."""
+    path = config.get("export", {}).get("csv_path", "exports/jobs_export.csv")
+    try:
+        f, writer = _open_csv(path)
+        with f:
+            writer.writerows(jobs)
+        logger.info("CSV export appended %d rows to %s", len(jobs), path)
+    except Exception as exc:
+        logger.error("CSV export failed: %s", exc)
@@ -8,24 +8,32 @@ Contract enforced on subclasses:
 
 Shared utilities provided here:
   • Rotating user-agent pool
-  • Rate-limited requests session (get / post)
-  • Retry logic with exponential back-off
+  • Rate-limited requests session (get / post), paced per host
+  • Retry logic with per-host exponential back-off
   • robots.txt compliance check
   • Relevance scoring against tag list
+  • Shared process pool for CPU-heavy HTML parsing
 """
 
 import abc
+import itertools
 import logging
+import multiprocessing
 import random
+import re
+import sys
+import threading
 import time
 import urllib.robotparser
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Tuple
 from urllib.parse import urlparse
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from requests.structures import CaseInsensitiveDict
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +41,8 @@ logger = logging.getLogger(__name__)
 # Job data model
 # ──────────────────────────────────────────────────────────────
 
-@dataclass
+# __slots__ (3.10+): no per-instance __dict__ – a run can build thousands of these
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class Job:
     title:       str
     company:     str
@@ -79,8 +88,179 @@ _USER_AGENTS = [
 ]
 
 
+# Rough real-world share of each UA above, so rotation looks like ordinary traffic
+_UA_CUM_WEIGHTS = list(itertools.accumulate([0.4, 0.2, 0.2, 0.1, 0.1]))
+
+# One complete header set per UA, built once. Sessions point at one of
+# these instead of rebuilding headers per request – so never mutate
+# session.headers in place; pass per-request headers to _get/_post.
+_HEADER_TEMPLATES = tuple(
+    CaseInsensitiveDict({
+        **requests.utils.default_headers(),
+        "User-Agent": ua,
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    })
+    for ua in _USER_AGENTS
+)
+
+
 def random_user_agent() -> str:
-    return random.choice(_USER_AGENTS)
+    return random.choices(_USER_AGENTS, cum_weights=_UA_CUM_WEIGHTS)[0]
+
+
+def _random_headers() -> CaseInsensitiveDict:
+    return random.choices(_HEADER_TEMPLATES, cum_weights=_UA_CUM_WEIGHTS)[0]
+
+
+# Product token matched against robots.txt User-agent lines ("Mozilla/5.0")
+_ROBOTS_UA = _USER_AGENTS[0].split("(")[0].strip()
+
+_Robots = urllib.robotparser.RobotFileParser
+
+_ROBOTS_TTL       = 3600.0   # seconds before a site's robots.txt is re-read
+_ROBOTS_MAX_SITES = 512
+
+
+# Chromium flags for the per-thread browser shared between scrapers
+# (see scrapers/browser_pool.py)
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-infobars",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--blink-settings=imagesEnabled=false",
+]
+
+
+# Resource types no scraper reads. Aborting them in the browser context
+# saves their download and decode, so pages reach domcontentloaded and
+# render sooner.
+BLOCKED_RESOURCES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+def block_resources(context, types=BLOCKED_RESOURCES) -> None:
+    """Abort requests of the given resource types for every page in `context`."""
+    def _route(route):
+        if route.request.resource_type in types:
+            route.abort()
+        else:
+            route.continue_()
+    context.route("**/*", _route)
+
+
+# Playwright timeouts (ms). A hung navigation or Cloudflare challenge then
+# fails that one query quickly instead of holding the scraper's lane for
+# 45–60 s; explicit per-call timeouts still override these.
+NAV_TIMEOUT_MS    = 15_000
+ACTION_TIMEOUT_MS = 6_000
+
+
+def set_timeouts(context) -> None:
+    """Apply the default navigation / action timeouts to every page in `context`."""
+    context.set_default_navigation_timeout(NAV_TIMEOUT_MS)
+    context.set_default_timeout(ACTION_TIMEOUT_MS)
+
+
+# ──────────────────────────────────────────────────────────────
+# Per-host pacing
+# ──────────────────────────────────────────────────────────────
+# Scrapers run on separate threads, so the request schedule is kept per
+# host and shared by all of them: requests to different hosts never wait
+# on each other, while requests to one host stay at least rate_limit
+# apart however many scrapers are hitting it.
+
+_MAX_RETRY_AFTER = 300.0    # ignore absurd Retry-After values (seconds)
+_BACKOFF_BASE    = 1.5      # first back-off after a failure (seconds)
+_BACKOFF_CAP     = 60.0
+_RETRY_STATUS    = frozenset({429, 500, 502, 503, 504})
+
+_host_lock = threading.Lock()
+_host_next: Dict[str, float] = {}     # netloc → earliest monotonic start time
+_host_failures: Dict[str, int] = {}   # netloc → consecutive failed attempts
+
+
+def _reserve_slot(host: str, interval: float) -> float:
+    """Book the next request slot for `host`; return seconds to wait for it."""
+    with _host_lock:
+        now   = time.monotonic()
+        start = max(now, _host_next.get(host, 0.0))
+        _host_next[host] = start + interval
+    return start - now
+
+
+def _defer_host(host: str, delay: float) -> None:
+    """Push the next slot for `host` at least `delay` seconds out."""
+    with _host_lock:
+        until = time.monotonic() + min(delay, _MAX_RETRY_AFTER)
+        if until > _host_next.get(host, 0.0):
+            _host_next[host] = until
+
+
+def _back_off(host: str, retry_after: Optional[float]) -> None:
+    """Record a failed attempt and hold `host` back accordingly."""
+    with _host_lock:
+        failures = _host_failures[host] = _host_failures.get(host, 0) + 1
+    if retry_after is None:
+        retry_after = (min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** (failures - 1))
+                       * random.uniform(0.8, 1.2))
+    _defer_host(host, retry_after)
+
+
+def _host_ok(host: str) -> None:
+    with _host_lock:
+        _host_failures.pop(host, None)
+
+
+def _retry_after(resp: Optional[requests.Response]) -> Optional[float]:
+    """Delta-seconds form of a Retry-After header, if the server sent one."""
+    if resp is None:
+        return None
+    value = resp.headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else None
+
+
+# ──────────────────────────────────────────────────────────────
+# Parse pool
+# ──────────────────────────────────────────────────────────────
+# Scrapers share one interpreter, so their HTML parsing contends for the
+# GIL even though each runs on its own lane. Large pages are handed to a
+# process pool instead; parse functions must be module-level and return
+# plain dicts so both their arguments and results pickle cheaply.
+
+_PARSE_TASKS_PER_CHILD = 100    # recycle workers to cap memory growth
+
+_pool_lock = threading.Lock()
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    global _parse_pool
+    with _pool_lock:
+        if _parse_pool is None:
+            kwargs = ({"max_tasks_per_child": _PARSE_TASKS_PER_CHILD}
+                      if sys.version_info >= (3, 11) else {})
+            # Always spawn: the pool is started from a scraper lane while
+            # other lanes (and Playwright's threads) are running, and forking
+            # a multi-threaded process can deadlock the child.
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                **kwargs,
+            )
+        return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parse workers, if any; the next parse starts a fresh pool."""
+    global _parse_pool
+    with _pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 # ──────────────────────────────────────────────────────────────
@@ -100,6 +280,7 @@ class BaseScraper(abc.ABC):
     """
 
     SOURCE_NAME: str = "unknown"   # override in every subclass
+    USES_BROWSER: bool = False     # True for Playwright-backed scrapers
 
     def __init__(self, config: dict) -> None:
         self.config = config
@@ -107,8 +288,13 @@ class BaseScraper(abc.ABC):
         self.rate_limit: float = float(scraper_cfg.get("rate_limit_seconds", 3))
         self.max_retries: int  = int(scraper_cfg.get("max_retries", 3))
         self.tags: List[str]   = config.get("search", {}).get("tags", [])
+        self.parse_workers: int = int(scraper_cfg.get("parse_workers", 2))
+        # Lowercased once here rather than per job in _score()
+        self._tags_lower       = [t.lower() for t in self.tags]
+        self._tag_re           = re.compile("|".join(map(re.escape, self._tags_lower)))
         self._session: Optional[requests.Session] = None
-        self._robots_cache: Dict[str, urllib.robotparser.RobotFileParser] = {}
+        # base URL → (parser or None if unreadable, monotonic fetch time), LRU order
+        self._robots_cache: "OrderedDict[str, Tuple[Optional[_Robots], float]]" = OrderedDict()
         self._setup()
         logger.debug("%s scraper initialised", self.SOURCE_NAME)
 
@@ -134,75 +320,131 @@ class BaseScraper(abc.ABC):
     # ── HTTP helpers ─────────────────────────────────────────────
 
     def _get_session(self) -> requests.Session:
-        """Lazy-init a session with retry middleware."""
+        """Lazy-init the session (retries are handled in _request)."""
         if self._session is None:
-            session = requests.Session()
-            retry = Retry(
-                total=self.max_retries,
-                backoff_factor=1.5,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "POST"],
-            )
-            adapter = HTTPAdapter(max_retries=retry)
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
-            self._session = session
+            self._session = requests.Session()
         # Rotate user-agent every call
-        self._session.headers.update({
-            "User-Agent": random_user_agent(),
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        })
+        self._session.headers = _random_headers()
         return self._session
 
+    def _throttle(self, url: str) -> str:
+        """
+        Keep at least rate_limit × jitter seconds between request starts
+        to the same host. Time already spent downloading / parsing since
+        the previous request counts towards the gap, so we only sleep the
+        remainder. Returns the host.
+        """
+        host = urlparse(url).netloc
+        wait = _reserve_slot(host, self.rate_limit * random.uniform(0.5, 1.5))
+        if wait > 0:
+            time.sleep(wait)
+        return host
+
+    def _request(self, method: str, url: str, **kwargs) -> Optional[requests.Response]:
+        """
+        Send a request with per-host pacing and retries. A 429/5xx or a
+        connection error backs off that host only – by Retry-After when
+        given, else exponentially with jitter – and the wait happens in
+        _throttle() before the next attempt, so it is never stacked on
+        top of the normal rate-limit gap.
+        """
+        error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            host = self._throttle(url)
+            try:
+                resp = self._get_session().request(method, url, timeout=20, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error, resp = exc, None
+            except requests.RequestException as exc:
+                error = exc
+                break
+            else:
+                if resp.status_code not in _RETRY_STATUS:
+                    _host_ok(host)
+                    try:
+                        resp.raise_for_status()
+                        return resp
+                    except requests.HTTPError as exc:
+                        error = exc
+                        break
+                kind  = "Client" if resp.status_code < 500 else "Server"
+                error = requests.HTTPError(
+                    f"{resp.status_code} {kind} Error: {resp.reason} for url: {resp.url}",
+                    response=resp,
+                )
+            if attempt < self.max_retries:
+                _back_off(host, _retry_after(resp))   # no retry left to wait for
+
+        logger.warning("%s %s failed [%s]: %s", self.SOURCE_NAME, method, url, error)
+        return None
+
     def _get(self, url: str, **kwargs) -> Optional[requests.Response]:
         """
         GET with built-in rate limiting, random jitter, and error handling.
         Returns None on failure instead of raising.
         """
-        jitter = random.uniform(0.5, 1.5)
-        time.sleep(self.rate_limit * jitter)
-        try:
-            resp = self._get_session().get(url, timeout=20, **kwargs)
-            resp.raise_for_status()
-            return resp
-        except requests.RequestException as exc:
-            logger.warning("%s GET failed [%s]: %s", self.SOURCE_NAME, url, exc)
-            return None
+        return self._request("GET", url, **kwargs)
 
     def _post(self, url: str, **kwargs) -> Optional[requests.Response]:
         """POST with the same safety wrapper."""
-        jitter = random.uniform(0.5, 1.5)
-        time.sleep(self.rate_limit * jitter)
-        try:
-            resp = self._get_session().post(url, timeout=20, **kwargs)
-            resp.raise_for_status()
-            return resp
-        except requests.RequestException as exc:
-            logger.warning("%s POST failed [%s]: %s", self.SOURCE_NAME, url, exc)
-            return None
+        return self._request("POST", url, **kwargs)
 
     # ── robots.txt compliance ─────────────────────────────────────
 
     def _can_fetch(self, url: str) -> bool:
-        """Check robots.txt before fetching a URL."""
+        """Check robots.txt (cached per site for _ROBOTS_TTL) before fetching a URL."""
         parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-        if base not in self._robots_cache:
-            rp = urllib.robotparser.RobotFileParser()
-            rp.set_url(f"{base}/robots.txt")
-            try:
-                rp.read()
-            except Exception:
-                # If we can't read robots.txt assume allowed
-                self._robots_cache[base] = None
-                return True
-            self._robots_cache[base] = rp
-        rp = self._robots_cache.get(base)
+        base   = f"{parsed.scheme}://{parsed.netloc}"
+        now    = time.monotonic()
+        entry  = self._robots_cache.get(base)
+        if entry is None or now - entry[1] > _ROBOTS_TTL:
+            entry = (self._read_robots(f"{base}/robots.txt"), now)
+            self._robots_cache[base] = entry
+            while len(self._robots_cache) > _ROBOTS_MAX_SITES:
+                self._robots_cache.popitem(last=False)
+        self._robots_cache.move_to_end(base)
+        rp = entry[0]
         if rp is None:
             return True
-        ua = random_user_agent().split("(")[0].strip()
-        return rp.can_fetch(ua, url)
+        return rp.can_fetch(_ROBOTS_UA, url)
+
+    def _read_robots(self, robots_url: str) -> Optional[_Robots]:
+        """
+        Fetch and parse robots.txt over the scraper's own session, paced
+        like any other request to that host. Status handling follows
+        RobotFileParser.read(): 401/403 and 5xx disallow everything, other
+        4xx allow everything. The result is cached for _ROBOTS_TTL, so a
+        site that was erroring is re-checked later. None (assume allowed)
+        if the request itself fails.
+        """
+        rp = _Robots(robots_url)
+        try:
+            self._throttle(robots_url)
+            resp = self._get_session().get(robots_url, timeout=10)
+        except Exception:
+            return None     # If we can't read robots.txt assume allowed
+        if resp.status_code in (401, 403) or resp.status_code >= 500:
+            rp.disallow_all = True
+        elif 400 <= resp.status_code < 500:
+            rp.allow_all = True
+        else:
+            rp.parse(resp.content.decode("utf-8", "replace").splitlines())
+        return rp
+
+    # ── CPU offload ───────────────────────────────────────────────
+
+    def _parse(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) in the shared parse pool (inline when parse_workers
+        is 0, or if the pool has died) and return its result.
+        """
+        if self.parse_workers > 0:
+            try:
+                return _get_parse_pool(self.parse_workers).submit(fn, *args).result()
+            except BrokenProcessPool as exc:
+                logger.warning("Parse pool unavailable, parsing inline: %s", exc)
+                self.parse_workers = 0
+        return fn(*args)
 
     # ── relevance scoring ─────────────────────────────────────────
 
@@ -211,9 +453,12 @@ class BaseScraper(abc.ABC):
         Simple keyword-match relevance score 0–100.
         Weights: title match > description match > tag matches.
         """
+        kw_lower = keyword.lower()
+        return self._score_prepared(job, kw_lower, kw_lower.split())
+
+    def _score_prepared(self, job: Job, kw_lower: str, kw_words: List[str]) -> float:
+        """_score() with the keyword already lowercased and split by the caller."""
         haystack_title = (job.title + " " + job.company).lower()
-        haystack_body  = job.description.lower()
-        kw_lower       = keyword.lower()
 
         score = 0.0
 
@@ -222,19 +467,29 @@ class BaseScraper(abc.ABC):
             score += 40.0
 
         # Partial word matches in title
-        for word in kw_lower.split():
+        for word in kw_words:
             if word in haystack_title:
                 score += 5.0
-
-        # Tag matches
-        for tag in self.tags:
-            tag_lower = tag.lower()
-            if tag_lower in haystack_title:
-                score += 10.0
-            elif tag_lower in haystack_body:
-                score += 3.0
-
-        return min(score, 100.0)
+        if score >= 100.0:
+            return 100.0
+
+        # Tag matches – one regex pass first: most listings mention none
+        # of the tags, and then the per-tag scan can be skipped entirely.
+        # Stop as soon as the cap is reached; later tags can't change it.
+        if self._tags_lower:
+            haystack_body = job.description.lower()
+            if self._tag_re.search(haystack_title) or self._tag_re.search(haystack_body):
+                for tag_lower in self._tags_lower:
+                    if tag_lower in haystack_title:
+                        score += 10.0
+                    elif tag_lower in haystack_body:
+                        score += 3.0
+                    else:
+                        continue
+                    if score >= 100.0:
+                        return 100.0
+
+        return score
 
     # ── safe wrapper ──────────────────────────────────────────────
 
@@ -245,10 +500,13 @@ class BaseScraper(abc.ABC):
         """
         try:
             jobs = self.search(keyword, location)
-            # Attach score and source
+            # Attach score and source; the keyword is the same for every job
+            kw_lower = keyword.lower()
+            kw_words = kw_lower.split()
+            score    = self._score_prepared
             for j in jobs:
                 j.source = self.SOURCE_NAME
-                j.score  = self._score(j, keyword)
+                j.score  = score(j, kw_lower, kw_words)
             return jobs
         except Exception as exc:
             logger.error(
@@ -0,0 +1,89 @@
+"""
+scrapers/browser_pool.py
+────────────────────────
+One Chromium per thread, shared by every Playwright scraper that runs
+on that thread.
+
+Launching Chromium is the slow, memory-hungry part of a browser
+scraper; a BrowserContext costs next to nothing and still isolates
+cookies and storage. So scrapers only create their own context and
+page, and borrow the browser from here.
+
+Sync Playwright objects can only be used from the thread that created
+them, hence one browser per thread rather than per process: scrapers
+on separate scheduler lanes each get their own, while scrapers sharing
+a lane (scrapers.share_browser, or diagnose.py's browser lane) share one.
+
+Each scraper's context state (cookies + localStorage) is also saved on
+cleanup and restored for the next run's context, so anti-bot clearance
+cookies survive restarts instead of being re-earned every run.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict
+
+from scrapers.base_scraper import CHROMIUM_ARGS
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+def get_browser(config: dict):
+    """This thread's shared Chromium, launched on first use."""
+    browser = getattr(_local, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    from playwright.sync_api import sync_playwright
+    if getattr(_local, "playwright", None) is None:
+        _local.playwright = sync_playwright().start()
+    headless = config.get("scrapers", {}).get("headless", True)
+    _local.browser = _local.playwright.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+    logger.debug("Launched shared Chromium on %s", threading.current_thread().name)
+    return _local.browser
+
+
+def close_browser() -> None:
+    """Close this thread's browser and Playwright driver, if any."""
+    browser    = getattr(_local, "browser", None)
+    playwright = getattr(_local, "playwright", None)
+    _local.browser = _local.playwright = None
+    try:
+        if browser is not None:
+            browser.close()
+        if playwright is not None:
+            playwright.stop()
+    except Exception:
+        pass
+
+
+# ──────────────────────────────────────────────────────────────
+# Context state (cookies + localStorage) across runs
+# ──────────────────────────────────────────────────────────────
+
+def _state_path(config: dict, source: str) -> str:
+    db_path = config.get("storage", {}).get("db_path", "storage/jobs.db")
+    return os.path.join(os.path.dirname(db_path), f"{source}_state.json")
+
+
+def saved_state(config: dict, source: str) -> Dict[str, Any]:
+    """new_context() kwargs restoring `source`'s last saved state, if usable."""
+    path = _state_path(config, source)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)    # a truncated file would make new_context() raise
+    except (OSError, ValueError):
+        return {}
+    return {"storage_state": path}
+
+
+def save_state(context, config: dict, source: str) -> None:
+    """Write `context`'s cookies + localStorage for the next run (best-effort)."""
+    try:
+        context.storage_state(path=_state_path(config, source))
+    except Exception as exc:
+        logger.debug("Could not save %s browser state: %s", source, exc)
@@ -11,12 +11,21 @@ Two modes:
      Works without API key but fragile and subject to CAPTCHAs.
 """
 
+import json
 import logging
 import os
 import urllib.parse
 from typing import List
 
+from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper, Job
+from storage.http_cache import HttpCache
+
+try:
+    import orjson                  # optional: faster decode of SerpAPI payloads
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +35,14 @@ class GoogleJobsScraper(BaseScraper):
     SERPAPI_URL  = "https://serpapi.com/search.json"
     GOOGLE_URL   = "https://www.google.com/search"
 
+    def _setup(self) -> None:
+        # SerpAPI answers for the same query barely change within a short
+        # window, so repeat runs reuse them instead of spending quota.
+        scraper_cfg     = self.config.get("scrapers", {})
+        self._cache_ttl = 60 * float(scraper_cfg.get("serpapi_cache_minutes", 30))
+        db_path         = self.config.get("storage", {}).get("db_path", "storage/jobs.db")
+        self._cache     = HttpCache(os.path.join(os.path.dirname(db_path), "http_cache.db"))
+
     def search(self, keyword: str, location: str) -> List[Job]:
         api_key = os.environ.get("SERPAPI_KEY", "")
         if api_key:
@@ -56,14 +73,24 @@ class GoogleJobsScraper(BaseScraper):
         if self.config.get("search", {}).get("remote_filter"):
             params["ltype"] = "1"   # remote listings
 
-        resp = self._get(
-            f"{self.SERPAPI_URL}?{urllib.parse.urlencode(params)}"
+        # Cache key leaves out the API key so a rotated key still hits
+        cache_key = f"{self.SERPAPI_URL}?" + urllib.parse.urlencode(
+            sorted((k, v) for k, v in params.items() if k != "api_key")
         )
-        if not resp:
-            return jobs
+        body = self._cache.get(cache_key, self._cache_ttl) if self._cache_ttl else None
+        cached = body is not None
+        if not cached:
+            resp = self._get(self.SERPAPI_URL, params=params)
+            if not resp:
+                return jobs
+            body = resp.content
+        else:
+            logger.debug("SerpAPI cache hit: %s", cache_key)
 
         try:
-            data = resp.json()
+            # Decode the raw bytes directly (JSON is UTF-8) – skips requests'
+            # encoding sniffing and the bytes → str copy of resp.json()
+            data = _json_loads(body)
         except ValueError:
             logger.warning("Google Jobs SerpAPI: non-JSON response")
             return jobs
@@ -72,6 +99,8 @@ class GoogleJobsScraper(BaseScraper):
         if error:
             logger.warning("SerpAPI error: %s", error)
             return jobs
+        if not cached and self._cache_ttl:
+            self._cache.put(cache_key, body)
 
         for item in data.get("jobs_results", []):
             try:
@@ -107,15 +136,16 @@ class GoogleJobsScraper(BaseScraper):
         The htidocid results panel contains job cards.
         Note: Google CAPTCHAs are common without a proxy.
         """
-        from bs4 import BeautifulSoup
         jobs: List[Job] = []
 
         query  = f"{keyword} jobs {location}"
         params = {"q": query, "ibp": "htl;jobs", "hl": "en"}
-        url    = f"{self.GOOGLE_URL}?{urllib.parse.urlencode(params)}"
 
+        # requests encodes `params` into the URL itself – no urlencode +
+        # f-string here for it to split apart and re-encode again
         resp = self._get(
-            url,
+            self.GOOGLE_URL,
+            params=params,
             headers={
                 "Accept-Language": "en-US,en;q=0.9",
                 "Accept":          "text/html,application/xhtml+xml,*/*;q=0.8",
@@ -131,7 +161,9 @@ class GoogleJobsScraper(BaseScraper):
             )
             return jobs
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        # Raw bytes: the charset is taken from the page itself and
+        # requests never builds (or guesses the encoding of) resp.text
+        soup = BeautifulSoup(resp.content, "lxml")
 
         # Google Jobs cards in the HTLP/jobs search result panel
         cards = (
@@ -3,25 +3,47 @@ scrapers/handshake_scraper.py
 ──────────────────────────────
 Handshake Scraper.
 Switched to Cloudscraper to bypass Cloudflare protection which
-was blocking Playwright/Requests.
+was blocking Playwright/Requests. If curl_cffi is installed it is
+preferred: it presents a real Chrome TLS/HTTP2 fingerprint from
+libcurl instead of solving the JS challenge in Python.
 """
 
 import logging
 import urllib.parse
 from typing import List
 
-import cloudscraper
 from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper, Job
 
 logger = logging.getLogger(__name__)
 
+
+# BeautifulSoup attribute matchers – defined once instead of a fresh
+# lambda per page / per link
+def _is_job_href(h) -> bool:
+    return bool(h) and ("/jobs/" in h or "/postings/" in h)
+
+
+def _is_card(c) -> bool:
+    return bool(c) and "card" in str(c).lower()
+
+
 class HandshakeScraper(BaseScraper):
     SOURCE_NAME = "handshake"
     SEARCH_URL = "https://joinhandshake.com/jobs/"
 
     def _setup(self) -> None:
+        try:
+            from curl_cffi import requests as curl_requests
+            self._scraper = curl_requests.Session(impersonate="chrome")
+            self._client  = "curl_cffi"
+            return
+        except ImportError:
+            pass
+
         # Initialize cloudscraper to handle Cloudflare challenges
+        import cloudscraper
+        self._client  = "Cloudscraper"
         self._scraper = cloudscraper.create_scraper(
             browser={
                 'browser': 'chrome',
@@ -39,20 +61,21 @@ class HandshakeScraper(BaseScraper):
         }
 
         try:
-            logger.info("Handshake (Cloudscraper) searching: %s", self.SEARCH_URL)
+            logger.info("Handshake (%s) searching: %s", self._client, self.SEARCH_URL)
             resp = self._scraper.get(self.SEARCH_URL, params=params, timeout=15)
 
             if resp.status_code != 200:
                 logger.warning("Handshake returned status %s", resp.status_code)
                 return jobs
 
-            soup = BeautifulSoup(resp.text, "lxml")
+            # bytes, not resp.text – see GoogleJobsScraper._html_search
+            soup = BeautifulSoup(resp.content, "lxml")
             jobs = self._parse_soup(soup, location)
 
             logger.info("Handshake returned %d jobs", len(jobs))
 
         except Exception as exc:
-            logger.error("Handshake Cloudscraper failed: %s", exc)
+            logger.error("Handshake %s failed: %s", self._client, exc)
 
         return jobs
 
@@ -62,7 +85,7 @@ class HandshakeScraper(BaseScraper):
 
         # Handshake's structure changes often. We look for any link containing /jobs/ or /postings/
         # and try to deduce the card content from its parent.
-        links = soup.find_all("a", href=lambda h: h and ("/jobs/" in h or "/postings/" in h))
+        links = soup.find_all("a", href=_is_job_href)
 
         for link in links[:30]:
             try:
@@ -71,7 +94,7 @@ class HandshakeScraper(BaseScraper):
                 if len(href) < 15: continue # Skip short/nav links
 
                 # Find the container (card)
-                card = link.find_parent("div", class_=lambda c: c and "card" in str(c).lower())
+                card = link.find_parent("div", class_=_is_card)
                 if not card:
                     card = link.parent # Fallback
 
@@ -9,20 +9,139 @@ import logging
 import urllib.parse
 import time
 import random
-from typing import List
+from typing import Dict, List, Tuple
 
-from bs4 import BeautifulSoup
-from scrapers.base_scraper import BaseScraper, Job
+from bs4 import BeautifulSoup, SoupStrainer
+from scrapers.base_scraper import BaseScraper, Job, block_resources, set_timeouts
+from scrapers.browser_pool import get_browser, save_state, saved_state
 
 logger = logging.getLogger(__name__)
 
+
+def _is_card_outline(c) -> bool:
+    """BeautifulSoup class matcher for the outlined-card fallback layout."""
+    return bool(c) and "card" in c and "outline" in c
+
+
+# Classes of every element a card can be found under: the four card
+# layouts below plus the `a.tapItem` wrapper the td layout links from.
+_CARD_CLASSES = {"job_seen_beacon", "resultContent", "slider_item", "tapItem"}
+
+
+def _is_card_part(c) -> bool:
+    """Strainer class matcher – `c` may be one class or the whole attribute."""
+    return bool(c) and (not _CARD_CLASSES.isdisjoint(c.split()) or _is_card_outline(c))
+
+
+# Only card subtrees are built into the soup; the rest of the page is
+# tokenised but never turned into Tag objects.
+_CARD_STRAINER = SoupStrainer(["a", "div", "td"], class_=_is_card_part)
+
+
+def _parse_cards(html: str, location: str) -> Tuple[List[Dict[str, str]], int]:
+    """
+    Extract up to 20 jobs from Indeed results HTML.
+
+    Module-level and dict-returning so it can run in the parse pool.
+    Returns (job field dicts, number of raw cards found).
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=_CARD_STRAINER)
+
+    # Multi-selector strategy
+    cards = (
+        soup.find_all("div", class_="job_seen_beacon")
+        or soup.find_all("td", class_="resultContent")
+        or soup.find_all("div", class_="slider_item")
+        or soup.find_all("div", class_=_is_card_outline)
+    )
+
+    jobs: List[Dict[str, str]] = []
+    for card in cards[:20]:
+        try:
+            # TITLE
+            title_el = (
+                card.find("h2", class_="jobTitle")
+                or card.find("a", attrs={"data-testid": "job-title"})
+                or card.find("span", attrs={"title": True})
+            )
+
+            if not title_el: continue
+
+            title = title_el.get_text(strip=True)
+            # Sometimes title is in a span inside the h2
+            if not title:
+                sp = title_el.find("span")
+                if sp: title = sp.get("title", "")
+
+            if not title: continue
+
+            # COMPANY
+            company_el = (
+                card.find("span", attrs={"data-testid": "company-name"})
+                or card.find("span", class_="companyName")
+                or card.find("a", attrs={"data-testid": "company-name"})
+            )
+            company = company_el.get_text(strip=True) if company_el else "Unknown"
+
+            # LOCATION
+            loc_el = (
+                card.find("div", attrs={"data-testid": "text-location"})
+                or card.find("div", class_="companyLocation")
+            )
+            loc = loc_el.get_text(strip=True) if loc_el else location
+
+            # LINK
+            link_el = card.find("a", href=True)
+            # If the card is a 'td', the link might be in a sibling or parent
+            if not link_el:
+                 link_el = card.find_parent("a", href=True)
+
+            href = link_el['href'] if link_el else ""
+            if href and not href.startswith("http"):
+                href = f"https://www.indeed.com{href}"
+
+            # DATE POSTED
+            date_el = card.find("span", class_="date")
+            date_posted = date_el.get_text(strip=True) if date_el else ""
+
+            jobs.append(dict(
+                title=title,
+                company=company,
+                location=loc,
+                url=href,
+                date_posted=date_posted,
+                source="indeed"
+            ))
+        except Exception as e:
+            logger.debug("Indeed card parse failed: %s", e)
+
+    return jobs, len(cards)
+
+
+# Page-side readiness checks for wait_for_function, called with
+# [CARD_SELECTOR, MIN_CARDS]. Layouts nest (a beacon holds a td), so
+# the count is the largest single-selector match, not their union.
+_CARDS_JS = """([sel, n]) =>
+    Math.max(...sel.split(",").map(s => document.querySelectorAll(s).length)) >= n
+        ? "cards" : false"""
+
+_CARDS_OR_CHALLENGE_JS = """([sel, n]) =>
+    /Just a moment|Verify|Cloudflare/.test(document.title) ? "challenge"
+        : Math.max(...sel.split(",").map(s => document.querySelectorAll(s).length)) >= n
+        ? "cards" : false"""
+
+
 class IndeedScraper(BaseScraper):
-    SOURCE_NAME = "indeed"
-    BASE_URL    = "https://www.indeed.com/jobs"
+    SOURCE_NAME  = "indeed"
+    USES_BROWSER = True
+    BASE_URL     = "https://www.indeed.com/jobs"
+    CARD_SELECTOR = "div.job_seen_beacon, td.resultContent, div.slider_item"
+    RESULTS_SELECTOR = "#mosaic-provider-jobcards, #mosaic-jobResults"
+    MIN_CARDS     = 10     # rendered cards that count as "results are in"
 
     def _setup(self) -> None:
-        self._playwright = None
         self._browser    = None
+        self._context    = None
         self._page       = None
 
     def search(self, keyword: str, location: str) -> List[Job]:
@@ -40,115 +159,75 @@ class IndeedScraper(BaseScraper):
         try:
             page = self._page
 
-            # 1. Navigate with extended timeout
+            # 1. Navigate (NAV_TIMEOUT_MS, set on the context)
             try:
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                page.goto(url, wait_until="domcontentloaded")
             except Exception as e:
                 logger.warning("Indeed navigation timeout (might still be loaded): %s", e)
 
-            # 2. Check for Cloudflare/Captcha
-            title = page.title()
-            if "Just a moment" in title or "Verify" in title or "Cloudflare" in title:
+            # 2+3. One condition-based wait covers both the Cloudflare check
+            #      and card rendering – it returns as soon as the page is
+            #      either a challenge or shows MIN_CARDS results.
+            state = self._wait_for_cards(page, _CARDS_OR_CHALLENGE_JS, 8000)
+            if state == "challenge":
                 logger.warning("Indeed hit Cloudflare challenge. Waiting for clearance...")
-                time.sleep(10) # Give it time to auto-solve if possible
-
-            # 3. Random human delay
-            time.sleep(random.uniform(3, 6))
+                # Give it time to auto-solve if possible
+                state = self._wait_for_cards(page, _CARDS_JS, 15000)
 
             # 4. Handle Popups (Google Sign-in, Cookies)
             self._close_popups(page)
 
-            # 5. Scroll to trigger lazy loading
-            for _ in range(3):
-                page.keyboard.press("PageDown")
-                time.sleep(random.uniform(0.8, 1.5))
-
-            # 6. Extract HTML
-            html = page.content()
-            soup = BeautifulSoup(html, "lxml")
-
-            # 7. Parse Job Cards (Multi-selector strategy)
-            cards = (
-                soup.find_all("div", class_="job_seen_beacon")
-                or soup.find_all("td", class_="resultContent")
-                or soup.find_all("div", class_="slider_item")
-                or soup.find_all("div", class_=lambda c: c and "card" in c and "outline" in c)
-            )
+            # 5. Scroll to trigger lazy loading – only needed when the
+            #    first screen didn't already render enough cards
+            if state != "cards":
+                for _ in range(3):
+                    page.keyboard.press("PageDown")
+                    time.sleep(random.uniform(0.8, 1.5))
+
+            # 6. Extract HTML – just the results list when we can find it;
+            #    the whole page is many times larger (scripts, nav, footer)
+            #    and BeautifulSoup's tree build is the slow part of a parse.
+            html = self._results_html(page)
+
+            # 7. Parse job cards – in the shared parse pool, off the GIL
+            parsed, n_cards = self._parse(_parse_cards, html, location)
 
             # Verification log
-            if not cards:
+            if not n_cards:
                 # Debug: check if we are on the wrong page
-                if "did not match any jobs" in html:
+                if "did not match any jobs" in page.content():
                     logger.info("Indeed: No results found for query.")
                 else:
                     logger.warning("Indeed: Page loaded but no cards found. Possible blocker.")
 
-            logger.info("Indeed found %d raw cards", len(cards))
-
-            for card in cards[:20]:
-                try:
-                    # TITLE
-                    title_el = (
-                        card.find("h2", class_="jobTitle")
-                        or card.find("a", attrs={"data-testid": "job-title"})
-                        or card.find("span", attrs={"title": True})
-                    )
-
-                    if not title_el: continue
-
-                    title = title_el.get_text(strip=True)
-                    # Sometimes title is in a span inside the h2
-                    if not title:
-                        sp = title_el.find("span")
-                        if sp: title = sp.get("title", "")
-
-                    if not title: continue
-
-                    # COMPANY
-                    company_el = (
-                        card.find("span", attrs={"data-testid": "company-name"})
-                        or card.find("span", class_="companyName")
-                        or card.find("a", attrs={"data-testid": "company-name"})
-                    )
-                    company = company_el.get_text(strip=True) if company_el else "Unknown"
-
-                    # LOCATION
-                    loc_el = (
-                        card.find("div", attrs={"data-testid": "text-location"})
-                        or card.find("div", class_="companyLocation")
-                    )
-                    loc = loc_el.get_text(strip=True) if loc_el else location
-
-                    # LINK
-                    link_el = card.find("a", href=True)
-                    # If the card is a 'td', the link might be in a sibling or parent
-                    if not link_el:
-                         link_el = card.find_parent("a", href=True)
-
-                    href = link_el['href'] if link_el else ""
-                    if href and not href.startswith("http"):
-                        href = f"https://www.indeed.com{href}"
-
-                    # DATE POSTED
-                    date_el = card.find("span", class_="date")
-                    date_posted = date_el.get_text(strip=True) if date_el else ""
-
-                    jobs.append(Job(
-                        title=title,
-                        company=company,
-                        location=loc,
-                        url=href,
-                        date_posted=date_posted,
-                        source="indeed"
-                    ))
-                except Exception as e:
-                    logger.debug("Indeed card parse failed: %s", e)
+            logger.info("Indeed found %d raw cards", n_cards)
+            jobs = [Job(**d) for d in parsed]
 
         except Exception as exc:
             logger.error("Indeed search failed: %s", exc)
 
         return jobs
 
+    def _wait_for_cards(self, page, js: str, timeout: int) -> str:
+        """Poll `js` in the page; its result ("cards"/"challenge"), or "" on timeout."""
+        try:
+            handle = page.wait_for_function(
+                js, arg=[self.CARD_SELECTOR, self.MIN_CARDS], timeout=timeout
+            )
+            return handle.json_value()
+        except Exception:
+            return ""   # no results, a blocker, or a navigation mid-wait
+
+    def _results_html(self, page) -> str:
+        """Inner HTML of the job-results container, or the full page as a fallback."""
+        try:
+            el = page.query_selector(self.RESULTS_SELECTOR)
+            if el:
+                return el.inner_html()
+        except Exception:
+            pass
+        return page.content()
+
     def _close_popups(self, page):
         """Attempts to close the Google Sign-in iframe and cookie banners."""
         try:
@@ -173,33 +252,24 @@ class IndeedScraper(BaseScraper):
     def _ensure_playwright(self) -> bool:
         if self._page: return True
         try:
-            from playwright.sync_api import sync_playwright
-            self._playwright = sync_playwright().start()
-            headless = self.config.get("scrapers", {}).get("headless", True)
-
-            # Stealth Args
-            self._browser = self._playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-infobars",
-                    "--disable-dev-shm-usage",
-                    "--disable-extensions",
-                    "--disable-gpu",
-                ]
-            )
+            # Chromium is shared per thread; this scraper only owns a context
+            self._browser = get_browser(self.config)
 
             ctx = self._browser.new_context(
                 viewport={"width": 1366, "height": 768},
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
                 locale="en-US",
                 device_scale_factor=1,
+                **saved_state(self.config, self.SOURCE_NAME),
             )
 
             # Hide webdriver property
             ctx.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Cards are read from the HTML, so styling and media are dead weight
+            block_resources(ctx)
+            set_timeouts(ctx)
 
+            self._context = ctx
             self._page = ctx.new_page()
             return True
         except Exception as exc:
@@ -208,7 +278,9 @@ class IndeedScraper(BaseScraper):
 
     def cleanup(self) -> None:
         try:
-            if self._browser: self._browser.close()
-            if self._playwright: self._playwright.stop()
+            # The browser belongs to browser_pool; only our context is closed
+            if self._context:
+                save_state(self._context, self.config, self.SOURCE_NAME)
+                self._context.close()
         except: pass
         super().cleanup()
\ No newline at end of file
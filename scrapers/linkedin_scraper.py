@@ -13,37 +13,114 @@ import time
 import urllib.parse
 from typing import List
 
-from scrapers.base_scraper import BaseScraper, Job
+from scrapers.base_scraper import (
+    BLOCKED_RESOURCES, BaseScraper, Job, block_resources, set_timeouts,
+)
+from scrapers.browser_pool import get_browser, save_state, saved_state
 
 logger = logging.getLogger(__name__)
 
+# Each list is tried in order; the first selector that matches wins
+_SELECTORS = {
+    # LinkedIn A/B tests layouts
+    "cards": [
+        "li.jobs-search-results__list-item",
+        "div.base-card",
+        "li.ember-view[data-occludable-job-id]",
+        "[data-job-id]",
+    ],
+    "title": [
+        "h3.base-search-card__title",
+        "h3.job-search-card__title",
+        ".job-search-card__title",
+        "a[data-tracking-control-name]",
+    ],
+    "company": ["h4.base-search-card__subtitle", "a.hidden-nested-link", ".job-search-card__subtitle"],
+    "href":    ["a.base-card__full-link", "a[href*='/jobs/view/']", "a"],
+    # Modal / sign-in wall close buttons (all that are showing get clicked)
+    "dismiss": [
+        "button[aria-label='Dismiss']",
+        ".modal__dismiss",
+        "button.contextual-sign-in-modal__modal-dismiss",
+        "[data-tracking-control-name='public_jobs_contextual-sign-in-modal_modal_dismiss']",
+    ],
+}
+
+# Any layout's card – used to wait for results to render
+_CARD_SELECTOR = ", ".join(_SELECTORS["cards"])
+
+# Clicks each visible dismiss control; returns how many were clicked
+_DISMISS_JS = """(sels) => {
+    let clicked = 0;
+    for (const s of sels) {
+        const el = document.querySelector(s);
+        if (el && el.getClientRects().length) {
+            el.click();
+            clicked++;
+        }
+    }
+    return clicked;
+}"""
+
+# Cards rendered so far. Layouts nest (an li wraps a div.base-card), so
+# this is the largest single-selector count rather than their union.
+_COUNT_JS = "(sels) => Math.max(...sels.map((s) => document.querySelectorAll(s).length))"
+
+# Runs in the page: the first 20 cards as plain objects. `loc` is null
+# when the card has no location element (the caller substitutes its own).
+_EXTRACT_JS = """(sel) => {
+    let cards = [];
+    for (const s of sel.cards) {
+        cards = document.querySelectorAll(s);
+        if (cards.length) break;
+    }
+    const first = (card, list) => {
+        for (const s of list) {
+            const el = card.querySelector(s);
+            if (el) return el;
+        }
+        return null;
+    };
+    const text = (el) => el ? el.innerText.trim() : "";
+    const rows = Array.from(cards).slice(0, 20).map((card) => {
+        let href = "";
+        for (const s of sel.href) {
+            const el = card.querySelector(s);
+            href = el ? (el.getAttribute("href") || "") : "";
+            if (href) break;
+        }
+        const loc  = card.querySelector("span.job-search-card__location");
+        const time = card.querySelector("time");
+        return {
+            title:   text(first(card, sel.title)),
+            company: text(first(card, sel.company)),
+            loc:     loc ? loc.innerText.trim() : null,
+            date:    (time && time.getAttribute("datetime")) || "",
+            href:    href,
+        };
+    });
+    return {count: cards.length, rows: rows};
+}"""
+
 
 class LinkedInScraper(BaseScraper):
-    SOURCE_NAME = "linkedin"
-    SEARCH_URL  = "https://www.linkedin.com/jobs/search/"
+    SOURCE_NAME  = "linkedin"
+    USES_BROWSER = True
+    SEARCH_URL   = "https://www.linkedin.com/jobs/search/"
 
     def _setup(self) -> None:
-        self._playwright = None
         self._browser    = None
         self._context    = None
         self._page       = None
+        self._warm       = False    # page has completed a search navigation
 
     def _ensure_browser(self) -> bool:
         if self._page is not None:
             return True
         try:
-            from playwright.sync_api import sync_playwright
-            self._playwright = sync_playwright().start()
-            headless = self.config.get("scrapers", {}).get("headless", True)
-            self._browser = self._playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                ],
-            )
+            # Chromium is shared per thread; this scraper only owns a context
+            self._browser = get_browser(self.config)
+
             self._context = self._browser.new_context(
                 user_agent=(
                     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -53,10 +130,14 @@ class LinkedInScraper(BaseScraper):
                 viewport={"width": 1366, "height": 768},
                 locale="en-US",
                 extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+                **saved_state(self.config, self.SOURCE_NAME),
             )
             self._context.add_init_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
+            # Stylesheets stay: innerText (used to read the cards) follows layout
+            block_resources(self._context, BLOCKED_RESOURCES - {"stylesheet"})
+            set_timeouts(self._context)
             self._page = self._context.new_page()
 
             # Optional: inject saved cookie for logged-in access
@@ -100,92 +181,56 @@ class LinkedInScraper(BaseScraper):
         try:
             page = self._page
 
-            # Navigate with generous timeout
-            page.goto(url, wait_until="domcontentloaded", timeout=45000)
-            time.sleep(random.uniform(3, 5))
-
-            # Dismiss any modals/popups
-            for selector in [
-                "button[aria-label='Dismiss']",
-                ".modal__dismiss",
-                "button.contextual-sign-in-modal__modal-dismiss",
-                "[data-tracking-control-name='public_jobs_contextual-sign-in-modal_modal_dismiss']",
-            ]:
-                try:
-                    page.click(selector, timeout=2000)
+            # Navigate (NAV_TIMEOUT_MS, set on the context), then wait for the first card
+            # to render instead of a blind 3–5 s pause. The page stays open
+            # between queries; later searches navigate from the previous one
+            # with a LinkedIn referer, as an in-app search would.
+            page.goto(
+                url, wait_until="domcontentloaded",
+                referer=self.SEARCH_URL if self._warm else None,
+            )
+            self._warm = True
+            try:
+                page.wait_for_selector(_CARD_SELECTOR, timeout=8000)
+            except Exception:
+                pass    # no results or a sign-in wall – reported below
+
+            # Dismiss any modals/popups – checked and clicked in one round-trip
+            try:
+                if page.evaluate(_DISMISS_JS, _SELECTORS["dismiss"]):
                     time.sleep(0.5)
-                except Exception:
-                    pass
+            except Exception:
+                pass
 
-            # Scroll to load job cards
+            # Scroll to load job cards – stop once the 20 we read are there
             for _ in range(4):
+                if page.evaluate(_COUNT_JS, _SELECTORS["cards"]) >= 20:
+                    break
                 page.evaluate("window.scrollBy(0, 700)")
-                time.sleep(random.uniform(0.8, 1.5))
-
-            # Try multiple card selectors (LinkedIn A/B tests layouts)
-            cards = (
-                page.query_selector_all("li.jobs-search-results__list-item")
-                or page.query_selector_all("div.base-card")
-                or page.query_selector_all("li.ember-view[data-occludable-job-id]")
-                or page.query_selector_all("[data-job-id]")
-            )
+                time.sleep(random.uniform(0.5, 0.9))
 
-            logger.debug("LinkedIn found %d raw cards", len(cards))
+            # Read every card in one page.evaluate() – a query_selector /
+            # inner_text per field would be a CDP round-trip each
+            found = page.evaluate(_EXTRACT_JS, _SELECTORS)
 
-            for card in cards[:20]:
-                try:
-                    # Title — try multiple selectors
-                    title = ""
-                    for sel in [
-                        "h3.base-search-card__title",
-                        "h3.job-search-card__title",
-                        ".job-search-card__title",
-                        "a[data-tracking-control-name]",
-                    ]:
-                        el = card.query_selector(sel)
-                        if el:
-                            title = el.inner_text().strip()
-                            break
+            logger.debug("LinkedIn found %d raw cards", found["count"])
 
+            for row in found["rows"]:
+                try:
+                    title = row["title"]
                     if not title:
                         continue
 
-                    # Company
-                    company = ""
-                    for sel in ["h4.base-search-card__subtitle", "a.hidden-nested-link", ".job-search-card__subtitle"]:
-                        el = card.query_selector(sel)
-                        if el:
-                            company = el.inner_text().strip()
-                            break
-
-                    # Location
-                    loc = location
-                    loc_el = card.query_selector("span.job-search-card__location")
-                    if loc_el:
-                        loc = loc_el.inner_text().strip()
-
-                    # Date
-                    date_el = card.query_selector("time")
-                    date_str = date_el.get_attribute("datetime") if date_el else ""
-
-                    # URL
-                    href = ""
-                    for sel in ["a.base-card__full-link", "a[href*='/jobs/view/']", "a"]:
-                        el = card.query_selector(sel)
-                        if el:
-                            href = el.get_attribute("href") or ""
-                            if href:
-                                break
-
+                    href = row["href"]
                     if href:
                         href = href.split("?")[0]
 
                     jobs.append(Job(
                         title=title,
-                        company=company or "Unknown",
-                        location=loc,
+                        company=row["company"] or "Unknown",
+                        location=row["loc"] if row["loc"] is not None else location,
                         url=href,
-                        date_posted=date_str,
+                        date_posted=row["date"],
                     ))
                 except Exception as exc:
                     logger.debug("LinkedIn card parse error: %s", exc)
@@ -198,10 +243,10 @@ class LinkedInScraper(BaseScraper):
 
     def cleanup(self) -> None:
         try:
-            if self._browser:
-                self._browser.close()
-            if self._playwright:
-                self._playwright.stop()
+            # The browser belongs to browser_pool; only our context is closed
+            if self._context:
+                save_state(self._context, self.config, self.SOURCE_NAME)
+                self._context.close()
         except Exception:
             pass
         super().cleanup()
\ No newline at end of file
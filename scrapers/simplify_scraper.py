@@ -10,20 +10,118 @@ import logging
 import urllib.parse
 import time
 import random
-from typing import List
+from typing import Dict, List
 
 from bs4 import BeautifulSoup
-from scrapers.base_scraper import BaseScraper, Job
+from scrapers.base_scraper import BaseScraper, Job, block_resources, set_timeouts
+from scrapers.browser_pool import get_browser, save_state, saved_state
 
 logger = logging.getLogger(__name__)
 
+
+# BeautifulSoup attribute matchers – defined once instead of a fresh
+# lambda per page / per link
+def _is_job_href(h) -> bool:
+    return bool(h) and "/jobs/" in h
+
+
+def _is_bordered(c) -> bool:
+    return bool(c) and "border" in str(c)
+
+
+# Distinct job links on the page (cards often link the same job twice)
+_COUNT_JOBS_JS = """() => new Set(
+    Array.from(document.querySelectorAll("a[href*='/jobs/']"),
+               (a) => a.getAttribute("href").split("?")[0])
+).size"""
+
+
+def _parse_links(html: str, location: str) -> List[Dict[str, str]]:
+    """
+    Jobs from a rendered Simplify results page, as Job field dicts.
+    Module-level so BaseScraper._parse can run it in the parse pool.
+    """
+    jobs: List[Dict[str, str]] = []
+    soup = BeautifulSoup(html, "lxml")
+
+    # Find all anchor tags that point to a job detail page
+    links = soup.find_all("a", href=_is_job_href)
+    seen_ids = set()
+
+    for link in links:
+        try:
+            href = link['href']
+
+            # Extract UUID to deduplicate (e.g. /jobs/1234-5678)
+            job_uuid = href.split("?")[0]
+            if job_uuid in seen_ids:
+                continue
+            seen_ids.add(job_uuid)
+
+            # Title is usually the text of the link
+            title = link.get_text(" ", strip=True)
+            if not title: continue
+
+            # Find the Container (Card) to extract Company/Location
+            # The <a> is usually inside a div or li. We walk up to find the container.
+            container = link.find_parent("li")
+            if not container:
+                 # Fallback for different layouts
+                container = link.find_parent("div", class_=_is_bordered)
+
+            company = "Unknown"
+            loc = location
+
+            if container:
+                # Extract all text from the card
+                text_parts = list(container.stripped_strings)
+
+                # Heuristic: Filter out the title, "Apply", "New", etc.
+                # Usually the structure is: [Title, Company, Location, Type...]
+                clean_parts = [
+                    t for t in text_parts
+                    if t != title and "apply" not in t.lower() and "new" != t.lower()
+                ]
+
+                if clean_parts:
+                    # The first non-title element is usually the Company
+                    company = clean_parts[0]
+
+                    # Look for something that looks like a location (contains comma or "Remote")
+                    for part in clean_parts[1:]:
+                        if "," in part or "Remote" in part or "Hybrid" in part:
+                            loc = part
+                            break
+
+            # Normalize URL
+            if href.startswith("/"):
+                href = f"https://simplify.jobs{href}"
+
+            jobs.append(dict(
+                title=title,
+                company=company,
+                location=loc,
+                url=href,
+                source="simplify"
+            ))
+
+        except Exception as e:
+            logger.debug("Simplify card parse error: %s", e)
+
+    return jobs
+
+
 class SimplifyScraper(BaseScraper):
-    SOURCE_NAME = "simplify"
-    BASE_URL    = "https://simplify.jobs/jobs"
+    SOURCE_NAME  = "simplify"
+    USES_BROWSER = True
+    BASE_URL     = "https://simplify.jobs/jobs"
+    ENOUGH_JOBS  = 20      # stop scrolling once this many distinct jobs are listed
+    RESULTS_SELECTOR  = "main"
+    JOB_LINK_SELECTOR = "a[href*='/jobs/']"
 
     def _setup(self) -> None:
-        self._playwright = None
         self._browser    = None
+        self._context    = None
         self._page       = None
 
     def search(self, keyword: str, location: str) -> List[Job]:
@@ -87,128 +185,69 @@ class SimplifyScraper(BaseScraper):
             page = self._page
 
             # Navigate
-            page.goto(url, wait_until="domcontentloaded", timeout=45000)
-
-            # Human-like delay
-            time.sleep(random.uniform(3, 5))
+            page.goto(url, wait_until="domcontentloaded")
 
             # Wait for results to load
             try:
-                # Wait for at least one job link to appear
+                # Wait for at least one job link to appear – returns as soon
+                # as it does, so no fixed delay is needed before it
                 page.wait_for_selector("a[href*='/jobs/']", timeout=15000)
             except:
                 logger.warning("Simplify: Timeout waiting for job cards (possible 0 results or CAPTCHA).")
 
-            # Scroll to trigger lazy loading
+            # Scroll to trigger lazy loading, unless enough jobs are already in
             for _ in range(4):
+                if page.evaluate(_COUNT_JOBS_JS) >= self.ENOUGH_JOBS:
+                    break
                 page.keyboard.press("PageDown")
-                time.sleep(random.uniform(1.0, 1.5))
+                time.sleep(random.uniform(0.5, 0.9))
 
             # ─────────────────────────────────────────────────────────────
             # 3. HTML Parsing
             # ─────────────────────────────────────────────────────────────
-            html = page.content()
-            soup = BeautifulSoup(html, "lxml")
-
-            # Find all anchor tags that point to a job detail page
-            links = soup.find_all("a", href=lambda h: h and "/jobs/" in h)
-            seen_ids = set()
-
-            for link in links:
-                try:
-                    href = link['href']
-
-                    # Extract UUID to deduplicate (e.g. /jobs/1234-5678)
-                    job_uuid = href.split("?")[0]
-                    if job_uuid in seen_ids:
-                        continue
-                    seen_ids.add(job_uuid)
-
-                    # Title is usually the text of the link
-                    title = link.get_text(" ", strip=True)
-                    if not title: continue
-
-                    # Find the Container (Card) to extract Company/Location
-                    # The <a> is usually inside a div or li. We walk up to find the container.
-                    container = link.find_parent("li")
-                    if not container:
-                         # Fallback for different layouts
-                        container = link.find_parent("div", class_=lambda c: c and "border" in str(c))
-
-                    company = "Unknown"
-                    loc = location
-
-                    if container:
-                        # Extract all text from the card
-                        text_parts = list(container.stripped_strings)
-
-                        # Heuristic: Filter out the title, "Apply", "New", etc.
-                        # Usually the structure is: [Title, Company, Location, Type...]
-                        clean_parts = [
-                            t for t in text_parts
-                            if t != title and "apply" not in t.lower() and "new" != t.lower()
-                        ]
-
-                        if clean_parts:
-                            # The first non-title element is usually the Company
-                            company = clean_parts[0]
-
-                            # Look for something that looks like a location (contains comma or "Remote")
-                            for part in clean_parts[1:]:
-                                if "," in part or "Remote" in part or "Hybrid" in part:
-                                    loc = part
-                                    break
-
-                    # Normalize URL
-                    if href.startswith("/"):
-                        href = f"https://simplify.jobs{href}"
-
-                    jobs.append(Job(
-                        title=title,
-                        company=company,
-                        location=loc,
-                        url=href,
-                        source="simplify"
-                    ))
-
-                except Exception as e:
-                    logger.debug("Simplify card parse error: %s", e)
+            # Parsed in the shared process pool (see BaseScraper._parse)
+            html = self._results_html(page)
+            jobs = [Job(**d) for d in self._parse(_parse_links, html, location)]
 
         except Exception as exc:
             logger.error("Simplify Playwright failed: %s", exc)
 
         return jobs
 
+    def _results_html(self, page) -> str:
+        """
+        Inner HTML of the page's <main> (the job list). Falls back to the
+        whole document when there is no <main>, or it holds no job links
+        (e.g. the listings moved outside it).
+        """
+        try:
+            el = page.query_selector(self.RESULTS_SELECTOR)
+            if el and el.query_selector(self.JOB_LINK_SELECTOR):
+                return el.inner_html()
+        except Exception:
+            pass
+        return page.content()
+
     def _ensure_playwright(self) -> bool:
         if self._page:
             return True
         try:
-            from playwright.sync_api import sync_playwright
-            self._playwright = sync_playwright().start()
-            headless = self.config.get("scrapers", {}).get("headless", True)
-
-            # STEALTH ARGS: Crucial for Simplify/Cloudflare
-            self._browser = self._playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-infobars",
-                    "--disable-dev-shm-usage",
-                    "--disable-extensions",
-                    "--disable-gpu",
-                ]
-            )
+            # Chromium is shared per thread; this scraper only owns a context
+            self._browser = get_browser(self.config)
 
             ctx = self._browser.new_context(
                 viewport={"width": 1440, "height": 900},
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                locale="en-US"
+                locale="en-US",
+                **saved_state(self.config, self.SOURCE_NAME),
             )
 
             # Mask the webdriver property
             ctx.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            block_resources(ctx)
+            set_timeouts(ctx)
 
+            self._context = ctx
             self._page = ctx.new_page()
             return True
         except Exception as exc:
@@ -217,7 +256,9 @@ class SimplifyScraper(BaseScraper):
 
     def cleanup(self) -> None:
         try:
-            if self._browser: self._browser.close()
-            if self._playwright: self._playwright.stop()
+            # The browser belongs to browser_pool; only our context is closed
+            if self._context:
+                save_state(self._context, self.config, self.SOURCE_NAME)
+                self._context.close()
         except: pass
         super().cleanup()
\ No newline at end of file
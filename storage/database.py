@@ -12,93 +12,276 @@ Responsibilities:
 import sqlite3
 import hashlib
 import logging
+import operator
 import os
+import queue
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Set
 
 logger = logging.getLogger(__name__)
 
 
-def _canonical_id(url: str, title: str, company: str) -> str:
-    """Stable fingerprint for a job listing regardless of source URL variations."""
+def _canonical_id(url: str, title: str, company: str) -> bytes:
+    """
+    Stable fingerprint for a job listing regardless of source URL variations.
+    The first 16 bytes of the SHA-256 digest, stored as a BLOB: a quarter of
+    the old 64-char hex key, so the primary-key index is far smaller.
+    """
     raw = f"{url.strip().lower()}::{title.strip().lower()}::{company.strip().lower()}"
-    return hashlib.sha256(raw.encode()).hexdigest()
+    return hashlib.sha256(raw.encode()).digest()[:16]
+
+
+# The primary key is the row itself (WITHOUT ROWID): a lookup by id is one
+# B-tree descent instead of the id index plus the rowid table.
+_JOBS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id          BLOB PRIMARY KEY,      -- sha256 fingerprint, 16 bytes
+        title       TEXT NOT NULL,
+        company     TEXT NOT NULL,
+        location    TEXT,
+        url         TEXT NOT NULL,
+        source      TEXT,                  -- which scraper found it
+        description TEXT,
+        date_posted TEXT,
+        score       REAL DEFAULT 0,        -- relevance score
+        discovered  TEXT NOT NULL,         -- ISO timestamp
+        notified    INTEGER DEFAULT 0      -- 1 once emailed
+    ) WITHOUT ROWID"""
+
+_JOB_COLUMNS = ("id, title, company, location, url, source, "
+                "description, date_posted, score, discovered, notified")
+
+_MAX_PARAMS = 500      # ids per "IN (…)" – well below SQLITE_MAX_VARIABLE_NUMBER
+_SEEN_MAX   = 200_000  # ids held in Database._seen (least recently used dropped)
+
+_INSERT_JOB = f"INSERT OR IGNORE INTO jobs ({_JOB_COLUMNS}) VALUES (?,?,?,?,?,?,?,?,?,?,0)"
+
+# What the notifiers and CSV export read from a pending job (`notified` is
+# always 0 there). description stays: it is capped at the source and shown
+# in the email / CSV.
+_PENDING_COLUMNS = ("id, title, company, location, url, source, "
+                    "description, date_posted, score, discovered")
+
+
+# _INSERT_JOB's columns between id and discovered, fetched in one C call
+_JOB_FIELDS    = ("title", "company", "location", "url", "source",
+                  "description", "date_posted", "score")
+_get_fields    = operator.itemgetter(*_JOB_FIELDS)
+_FIELD_DEFAULT = {**dict.fromkeys(_JOB_FIELDS, ""), "score": 0.0}
+
+
+def _job_row(job: Dict[str, Any], now: str) -> tuple:
+    """Parameter tuple for _INSERT_JOB."""
+    try:
+        fields = _get_fields(job)       # Job.to_dict() always has every key
+    except KeyError:
+        fields = _get_fields({**_FIELD_DEFAULT, **job})
+    title, company, _, url = fields[:4]
+    return (_canonical_id(url, title, company), *fields, now)
 
 
 class Database:
     """Thread-safe SQLite wrapper for job deduplication and config storage."""
 
+    _POOL_SIZE = 4    # idle reader connections kept open
+
     def __init__(self, db_path: str = "storage/jobs.db") -> None:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
+
+        # Connections live as long as the Database: one writer behind a
+        # lock, plus a small pool of readers. WAL lets the readers run
+        # alongside the writer, and reusing connections skips the
+        # open / page-cache / WAL-index setup every call used to pay.
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(self._POOL_SIZE)
+        self._write_lock = threading.Lock()
+        self._writer     = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")   # persistent: stored in the file
         self._init_schema()
+
+        # LRU of ids known to be in the table, so repeat listings (most of
+        # every run) are answered from memory instead of a B-tree lookup.
+        # Loaded on first use with the _SEEN_MAX most recent ids, and only
+        # added to once an insert has committed, so it never holds an id
+        # that is not stored; past _SEEN_MAX the least recently seen ids are
+        # dropped. While the whole table fits (the usual case) it is exact,
+        # so a miss is a new job too – the same answer a Bloom filter would
+        # give, with no false positives.
+        self._seen: "Optional[OrderedDict[bytes, None]]" = None
+        self._seen_all  = False     # _seen holds every stored id
+        self._seen_lock = threading.Lock()
         logger.info("Database ready at %s", db_path)
 
     # ──────────────────────────────────────────────────────────────
     # Context manager helpers
     # ──────────────────────────────────────────────────────────────
 
-    @contextmanager
-    def _conn(self):
-        """Yield a connection with row_factory set; auto-commit on exit."""
-        conn = sqlite3.connect(self.db_path, timeout=15)
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode (isolation_level=None): writes open their own
+        # transaction in _conn(), reads need none. Each connection keeps its
+        # compiled statements, so the hot INSERT / SELECT are parsed once.
+        conn = sqlite3.connect(self.db_path, timeout=15, check_same_thread=False,
+                               isolation_level=None, cached_statements=256)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")  # safe concurrent reads
+        # Per-connection settings. synchronous=NORMAL skips the fsync on
+        # every commit; in WAL mode that is still crash-safe (a power loss
+        # can only drop the last commits, never corrupt the file).
+        conn.executescript("""
+            PRAGMA synchronous  = NORMAL;
+            PRAGMA temp_store   = MEMORY;
+            PRAGMA mmap_size    = 268435456;   -- 256 MiB
+            PRAGMA cache_size   = -65536;      -- 64 MiB
+        """)
+        return conn
+
+    @contextmanager
+    def _conn(self, write: bool = False):
+        """
+        Yield a pooled connection with row_factory set. Pass write=True for
+        statements that modify the database: those all go through the one
+        writer, inside a transaction committed on exit and rolled back on
+        error.
+        """
+        if write:
+            with self._write_lock:
+                conn = self._writer
+                # IMMEDIATE takes the write lock up front, so a busy database
+                # waits out `timeout` here rather than failing mid-transaction
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
         finally:
-            conn.close()
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def close(self) -> None:
+        """Close the writer and every idle reader connection."""
+        with self._write_lock:
+            self._writer.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
 
     # ──────────────────────────────────────────────────────────────
     # Schema
     # ──────────────────────────────────────────────────────────────
 
     def _init_schema(self) -> None:
-        with self._conn() as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id          TEXT PRIMARY KEY,      -- sha256 fingerprint
-                    title       TEXT NOT NULL,
-                    company     TEXT NOT NULL,
-                    location    TEXT,
-                    url         TEXT NOT NULL,
-                    source      TEXT,                  -- which scraper found it
-                    description TEXT,
-                    date_posted TEXT,
-                    score       REAL DEFAULT 0,        -- relevance score
-                    discovered  TEXT NOT NULL,         -- ISO timestamp
-                    notified    INTEGER DEFAULT 0      -- 1 once emailed
-                );
-
+        with self._conn(write=True) as conn:
+            conn.execute(_JOBS_TABLE.format(table="jobs"))
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS keywords (
                     keyword TEXT PRIMARY KEY,
                     added   TEXT NOT NULL
-                );
-
+                )""")
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS run_log (
                     id          INTEGER PRIMARY KEY AUTOINCREMENT,
                     started_at  TEXT NOT NULL,
                     finished_at TEXT,
                     new_jobs    INTEGER DEFAULT 0,
                     status      TEXT DEFAULT 'running'
-                );
+                )""")
+            self._migrate(conn)
 
-                CREATE INDEX IF NOT EXISTS idx_jobs_notified ON jobs (notified);
-                CREATE INDEX IF NOT EXISTS idx_jobs_source   ON jobs (source);
-            """)
+            # Only the (few) pending rows, already in get_unnotified_jobs() order
+            conn.execute("DROP INDEX IF EXISTS idx_jobs_notified")
+            conn.execute("""CREATE INDEX IF NOT EXISTS idx_jobs_unnotified
+                            ON jobs (discovered DESC) WHERE notified = 0""")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source)")
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """
+        Bring a database created by an older version up to date. Runs in
+        _init_schema's transaction, so a failed step leaves the file as it was.
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # v1: ids went from 64-char hex TEXT to 16-byte BLOBs. The new id
+            # is a prefix of the old digest, so existing rows convert in place
+            # (a BLOB keeps its type even in a column declared TEXT).
+            conn.create_function(
+                "hex_to_id", 1, lambda h: bytes.fromhex(h)[:16], deterministic=True
+            )
+            conn.execute("UPDATE jobs SET id = hex_to_id(id) WHERE typeof(id) = 'text'")
+        if version < 2:
+            # v2: jobs became a WITHOUT ROWID table, which needs a rebuild
+            # (skipped for a table just created in the new form).
+            sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'jobs'"
+            ).fetchone()[0]
+            if "WITHOUT ROWID" not in sql.upper():
+                conn.execute(_JOBS_TABLE.format(table="jobs_v2"))
+                conn.execute(f"INSERT INTO jobs_v2 SELECT {_JOB_COLUMNS} FROM jobs")
+                conn.execute("DROP TABLE jobs")     # takes its indexes with it
+                conn.execute("ALTER TABLE jobs_v2 RENAME TO jobs")
+        conn.execute("PRAGMA user_version = 2")
 
     # ──────────────────────────────────────────────────────────────
     # Job CRUD
     # ──────────────────────────────────────────────────────────────
 
+    def _load_seen(self) -> "OrderedDict[bytes, None]":
+        """The id LRU, loaded oldest → newest on first use. Call with _seen_lock held."""
+        if self._seen is None:
+            with self._conn() as conn:
+                ids = [r[0] for r in conn.execute(
+                    "SELECT id FROM jobs ORDER BY discovered DESC LIMIT ?", (_SEEN_MAX,)
+                )]
+            self._seen     = OrderedDict.fromkeys(reversed(ids))
+            self._seen_all = len(ids) < _SEEN_MAX
+        return self._seen
+
+    def _unseen(self, ids: List[bytes]) -> Set[bytes]:
+        """Those of `ids` not in the LRU; the ones that are become most recent."""
+        with self._seen_lock:
+            seen = self._load_seen()
+            missing = set()
+            for job_id in ids:
+                if job_id in seen:
+                    seen.move_to_end(job_id)
+                else:
+                    missing.add(job_id)
+            return missing
+
+    def _remember(self, ids: List[bytes]) -> None:
+        """Record committed ids, dropping the least recently seen past _SEEN_MAX."""
+        with self._seen_lock:
+            seen = self._load_seen()
+            for job_id in ids:
+                seen[job_id] = None
+                seen.move_to_end(job_id)
+            while len(seen) > _SEEN_MAX:
+                seen.popitem(last=False)
+                self._seen_all = False
+
     def is_new(self, url: str, title: str, company: str) -> bool:
         """Return True if this job has NOT been seen before."""
         job_id = _canonical_id(url, title, company)
+        if not self._unseen([job_id]):
+            return False
+        if self._seen_all:
+            return True
         with self._conn() as conn:
             row = conn.execute(
                 "SELECT 1 FROM jobs WHERE id = ?", (job_id,)
@@ -107,58 +290,84 @@ class Database:
 
     def save_job(self, job: Dict[str, Any]) -> bool:
         """
-        Persist a new job. Returns True if inserted, False if duplicate.
-        The caller is responsible for calling is_new() first if they want
-        to filter before bulk inserts, but this is safe to call blindly.
+        Persist a new job. Returns True if inserted, False if duplicate –
+        INSERT OR IGNORE does the check, so no is_new() round-trip first.
         """
-        job_id = _canonical_id(
-            job.get("url", ""), job.get("title", ""), job.get("company", "")
-        )
-        now = datetime.utcnow().isoformat()
+        row = _job_row(job, datetime.utcnow().isoformat())
+        if not self._unseen([row[0]]):
+            return False
         try:
-            with self._conn() as conn:
-                conn.execute(
-                    """INSERT OR IGNORE INTO jobs
-                       (id, title, company, location, url, source,
-                        description, date_posted, score, discovered, notified)
-                       VALUES (?,?,?,?,?,?,?,?,?,?,0)""",
-                    (
-                        job_id,
-                        job.get("title", ""),
-                        job.get("company", ""),
-                        job.get("location", ""),
-                        job.get("url", ""),
-                        job.get("source", ""),
-                        job.get("description", ""),
-                        job.get("date_posted", ""),
-                        job.get("score", 0.0),
-                        now,
-                    ),
-                )
-            return True
+            with self._conn(write=True) as conn:
+                before = conn.total_changes
+                conn.execute(_INSERT_JOB, row)
+                inserted = conn.total_changes > before
+            self._remember([row[0]])    # committed (or already stored)
+            return inserted
         except Exception as exc:
             logger.error("save_job failed: %s", exc)
             return False
 
+    def save_jobs_bulk(self, jobs: List[Dict[str, Any]]) -> int:
+        """
+        Insert many jobs in one transaction and return how many were new.
+        Duplicates (same fingerprint) are skipped by the primary key, so
+        no is_new() pre-check is needed; ids already in memory are not
+        even sent to SQLite.
+        """
+        now    = datetime.utcnow().isoformat()
+        rows   = [_job_row(j, now) for j in jobs]
+        unseen = self._unseen([r[0] for r in rows])
+        rows   = [r for r in rows if r[0] in unseen]
+        if not rows:
+            return 0
+        try:
+            with self._conn(write=True) as conn:
+                before = conn.total_changes
+                conn.executemany(_INSERT_JOB, rows)
+                added = conn.total_changes - before
+            self._remember([r[0] for r in rows])
+            return added
+        except Exception as exc:
+            logger.error("save_jobs_bulk failed: %s", exc)
+            return 0
+
     def mark_notified(self, jobs: List[Dict[str, Any]]) -> None:
         """Bulk-mark a list of jobs as emailed."""
+        # Rows from get_unnotified_jobs() already carry their primary key
         ids = [
-            _canonical_id(j.get("url", ""), j.get("title", ""), j.get("company", ""))
+            j.get("id") or _canonical_id(
+                j.get("url", ""), j.get("title", ""), j.get("company", "")
+            )
             for j in jobs
         ]
+        with self._conn(write=True) as conn:
+            # One UPDATE per chunk, under SQLite's bound-parameter limit
+            for i in range(0, len(ids), _MAX_PARAMS):
+                chunk = ids[i:i + _MAX_PARAMS]
+                conn.execute(
+                    f"UPDATE jobs SET notified = 1 WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+
+    def iter_unnotified_jobs(self) -> Iterator[Dict]:
+        """
+        Yield jobs saved but not yet emailed, newest first, straight off the
+        cursor. The pooled connection is held until the generator finishes
+        or is closed, so stop early with a `break` / islice() freely.
+        """
         with self._conn() as conn:
-            conn.executemany(
-                "UPDATE jobs SET notified = 1 WHERE id = ?",
-                [(i,) for i in ids],
+            cur = conn.execute(
+                f"SELECT {_PENDING_COLUMNS} FROM jobs WHERE notified = 0 ORDER BY discovered DESC"
             )
+            try:
+                for row in cur:
+                    yield dict(row)
+            finally:
+                cur.close()
 
     def get_unnotified_jobs(self) -> List[Dict]:
         """Fetch all jobs that have been saved but not yet emailed."""
-        with self._conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM jobs WHERE notified = 0 ORDER BY discovered DESC"
-            ).fetchall()
-        return [dict(r) for r in rows]
+        return list(self.iter_unnotified_jobs())
 
     def total_jobs(self) -> int:
         with self._conn() as conn:
@@ -170,7 +379,7 @@ class Database:
 
     def add_keyword(self, keyword: str) -> bool:
         try:
-            with self._conn() as conn:
+            with self._conn(write=True) as conn:
                 conn.execute(
                     "INSERT OR IGNORE INTO keywords (keyword, added) VALUES (?,?)",
                     (keyword.strip(), datetime.utcnow().isoformat()),
@@ -183,7 +392,7 @@ class Database:
 
     def remove_keyword(self, keyword: str) -> bool:
         try:
-            with self._conn() as conn:
+            with self._conn(write=True) as conn:
                 conn.execute(
                     "DELETE FROM keywords WHERE keyword = ?", (keyword.strip(),)
                 )
@@ -206,7 +415,7 @@ class Database:
 
     def start_run(self) -> int:
         """Insert a run record and return its rowid."""
-        with self._conn() as conn:
+        with self._conn(write=True) as conn:
             cur = conn.execute(
                 "INSERT INTO run_log (started_at) VALUES (?)",
                 (datetime.utcnow().isoformat(),),
@@ -214,7 +423,7 @@ class Database:
             return cur.lastrowid
 
     def finish_run(self, run_id: int, new_jobs: int, status: str = "ok") -> None:
-        with self._conn() as conn:
+        with self._conn(write=True) as conn:
             conn.execute(
                 """UPDATE run_log
                    SET finished_at=?, new_jobs=?, status=?
@@ -0,0 +1,72 @@
+"""
+storage/http_cache.py
+─────────────────────
+Tiny persistent response cache (SQLite) for API calls that are
+repeated across runs – currently SerpAPI results for the same
+keyword/location. Entries older than the caller's TTL are treated
+as misses and overwritten on the next fetch.
+
+The cache is best-effort: any SQLite / filesystem error is logged at DEBUG and
+reported as a miss, so a locked or read-only file never breaks a run.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """Key → response body store with per-lookup max age."""
+
+    def __init__(self, path: str = "storage/http_cache.db") -> None:
+        self.path = path
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with self._conn() as conn:
+                conn.execute(
+                    """CREATE TABLE IF NOT EXISTS responses (
+                           key     TEXT PRIMARY KEY,
+                           fetched REAL NOT NULL,   -- unix time
+                           body    BLOB NOT NULL
+                       )"""
+                )
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("HTTP cache unavailable at %s: %s", path, exc)
+
+    @contextmanager
+    def _conn(self):
+        """Yield a short-lived connection; commit on success, always close."""
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key: str, max_age: float) -> Optional[bytes]:
+        """Body stored under `key` if it is at most `max_age` seconds old."""
+        try:
+            with self._conn() as conn:
+                row = conn.execute(
+                    "SELECT body FROM responses WHERE key = ? AND fetched >= ?",
+                    (key, time.time() - max_age),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug("HTTP cache read failed: %s", exc)
+            return None
+        return row[0] if row else None
+
+    def put(self, key: str, body: bytes) -> None:
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, fetched, body) VALUES (?,?,?)",
+                    (key, time.time(), body),
+                )
+        except sqlite3.Error as exc:
+            logger.debug("HTTP cache write failed: %s", exc)
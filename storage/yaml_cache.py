@@ -0,0 +1,90 @@
+"""
+storage/yaml_cache.py
+─────────────────────
+Memoised YAML loader shared by main.py and diagnose.py.
+
+Parsed documents are cached per path and keyed on the file's
+(mtime, size), so an edited config.yaml is picked up automatically
+while repeated loads of an unchanged file skip the YAML parse.
+Callers always receive a deep copy and may mutate it freely.
+
+Parsing uses libyaml's CSafeLoader when PyYAML was built with it and
+falls back to the pure-Python SafeLoader otherwise.
+
+Across processes, each parse is also saved as a JSON sidecar
+(`config.yaml.json`) stamped with the source file's mtime and size.
+While that stamp matches, later runs load the sidecar with the C json
+decoder and never import PyYAML. If the sidecar can't be written
+(read-only checkout, values JSON can't round-trip) we just parse the
+YAML every time.
+"""
+
+import copy
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+_MAX_ENTRIES = 100
+
+_cache: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _parse_yaml(path: str) -> Any:
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader    # libyaml C parser
+    except ImportError:                           # pragma: no cover
+        from yaml import SafeLoader as Loader
+    # Bytes straight to libyaml: it decodes UTF-8 itself, so skip TextIOWrapper
+    with open(path, "rb", buffering=1 << 16) as f:
+        return yaml.load(f, Loader=Loader) or {}
+
+
+def _read_sidecar(path: str, st: os.stat_result) -> Optional[Any]:
+    try:
+        with open(path + ".json", "r", encoding="utf-8") as f:
+            blob = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if blob.get("mtime_ns") != st.st_mtime_ns or blob.get("size") != st.st_size:
+        return None     # stale – config.yaml was edited since
+    return blob.get("data")
+
+
+def _write_sidecar(path: str, st: os.stat_result, data: Any) -> None:
+    try:
+        text = json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data})
+        if json.loads(text)["data"] != data:
+            return      # e.g. int keys would come back as strings
+        tmp = f"{path}.json.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path + ".json")    # atomic: readers never see half a file
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def load_yaml(path: str) -> Dict[str, Any]:
+    """Return the parsed YAML document at `path` ({} for an empty file)."""
+    key  = os.path.abspath(path)
+    st   = os.stat(key)
+    with _lock:
+        hit = _cache.get(key)
+        if hit and hit[0] == st.st_mtime and hit[1] == st.st_size:
+            _cache.move_to_end(key)
+            return copy.deepcopy(hit[2])
+
+    data = _read_sidecar(key, st)
+    if data is None:
+        data = _parse_yaml(key)
+        _write_sidecar(key, st, data)
+
+    with _lock:
+        _cache[key] = (st.st_mtime, st.st_size, data)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return copy.deepcopy(data)
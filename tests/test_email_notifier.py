@@ -0,0 +1,52 @@
+"""
+tests/test_email_notifier.py
+────────────────────────────
+EmailNotifier.send against an in-memory SMTP stand-in.
+"""
+
+import re
+
+from notifier.email_notifier import EmailNotifier
+
+
+class _FakeSMTP:
+    """Just enough of smtplib.SMTP for a pipelined send."""
+
+    def __init__(self) -> None:
+        self.payload = None
+
+    def has_extn(self, name: str) -> bool:
+        return name == "pipelining"
+
+    def send(self, commands: str) -> None:
+        pass
+
+    def getreply(self):
+        return 250, b"ok"
+
+    def data(self, payload: bytes):
+        self.payload = payload
+        return 250, b"ok"
+
+    def rset(self):
+        return 250, b"ok"
+
+    def quit(self) -> None:
+        pass
+
+
+def test_data_payload_uses_crlf_line_endings():
+    notifier            = EmailNotifier({})
+    notifier.sender     = "alerts@example.com"
+    notifier.password   = "secret"
+    notifier.recipients = ["me@example.com"]
+    server = _FakeSMTP()
+    notifier._get_conn = lambda: server
+
+    jobs = [{"title": "ML Engineer", "company": "Acme", "location": "Remote",
+             "url": "https://example.com/1", "source": "indeed", "score": 80.0}]
+    assert notifier.send(jobs)
+
+    assert server.payload
+    assert b"\r\n" in server.payload
+    assert not re.search(rb"(?<!\r)\n", server.payload), "bare LF in DATA"